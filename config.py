@@ -36,6 +36,12 @@ PLAYER_HEIGHT = 80
 
 BASE_SPAWN_RATE_MULTIPLIER = 1.0
 
+# Zombies further than this past either screen edge skip AI and collision checks
+ZOMBIE_ACTIVE_MARGIN = 200
+
+# Bullet spatial hash cell size as a bit shift (128px cells, about two zombie widths)
+BULLET_GRID_SHIFT = 7
+
 
 
 
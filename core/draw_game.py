@@ -2,7 +2,7 @@ import pygame
 import pygame.gfxdraw
 import math
 import random
-from zombie_types import ZOMBIE_TYPES, zombie_images, zombie_width, zombie_height
+from zombie_types import ZOMBIE_TYPE_KEYS, ZOMBIE_TYPE_LIST, zombie_images, zombie_width, zombie_height, zombie_deaths, spit_projectiles
 from weapon_types import WEAPON_TYPES, LETHAL_TYPES
 from config import *
 from core.player import Player
@@ -144,8 +144,9 @@ class GameRenderer:
             # Fallback to rectangle if no images provided
             pygame.draw.rect(self.screen, (0, 255, 0), (player_x, player_y, self.player.width, self.player.height))
 
-    def draw_zombie(self, zombie_x, zombie_y, zombie_type_key, zombie_health, max_health, zombie=None):
-        zombie_type = ZOMBIE_TYPES[zombie_type_key]
+    def draw_zombie(self, zombie_x, zombie_y, zombie_type_id, zombie_health, max_health, zombie=None):
+        zombie_type = ZOMBIE_TYPE_LIST[zombie_type_id]
+        zombie_type_key = ZOMBIE_TYPE_KEYS[zombie_type_id]
         
         # Scale image based on zombie size
         scaled_width = int(zombie_width * zombie_type.size)
@@ -383,19 +384,20 @@ class GameRenderer:
         """Draw death animations for zombies"""
         current_time = pygame.time.get_ticks()
         
-        # Import death animations list
-        from zombie_types import zombie_deaths, zombie_images
-        
-        for death in zombie_deaths[:]:
-            x, y, start_time, duration, zombie_type_key = death
+        # Compact finished animations in place, keeping draw order, instead
+        # of copying the list and calling remove() for each one
+        write_index = 0
+        for death in zombie_deaths:
+            x, y, start_time, duration, zombie_type_id = death
             
             # Calculate progress of animation (0.0 to 1.0)
             progress = (current_time - start_time) / duration
             
             if progress >= 1.0:
-                # Animation complete, remove it
-                zombie_deaths.remove(death)
+                # Animation complete, drop it
                 continue
+            zombie_deaths[write_index] = death
+            write_index += 1
             
             # Draw blood puddle
             if 'blood_puddle' in zombie_images:
@@ -421,7 +423,8 @@ class GameRenderer:
                 # During first half of animation, also show zombie fading out
                 if progress < 0.5:
                     # Get zombie type
-                    zombie_type = ZOMBIE_TYPES[zombie_type_key]
+                    zombie_type = ZOMBIE_TYPE_LIST[zombie_type_id]
+                    zombie_type_key = ZOMBIE_TYPE_KEYS[zombie_type_id]
                     
                     # Scale based on zombie size
                     scaled_width = int(zombie_width * zombie_type.size)
@@ -440,11 +443,11 @@ class GameRenderer:
                         # Draw at original position with slight sink effect
                         sink_y = y + (current_y - y) * progress * 2  # Sink toward puddle position
                         self.screen.blit(zombie_img, (x, sink_y))
+        
+        del zombie_deaths[write_index:]
 
     def draw_spit_projectiles(self):
         """Draw spit projectiles from spitter zombies"""
-        from zombie_types import spit_projectiles, zombie_images
-        
         for projectile in spit_projectiles:
             x, y = projectile[0], projectile[1]
             
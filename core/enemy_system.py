@@ -1,13 +1,44 @@
-import pygame
 import math
 import random
 from typing import Dict, List, Tuple, Optional, Set
 from core import player
 from core.player import Player
 from core.sound_controller import SoundController
-from zombie_types import ZOMBIE_TYPES, zombie_width, zombie_height, spit_projectiles, zombie_deaths
+from core.spatial_hash import SpatialHash
+from core.quadtree import QuadNode
+from weapon_types import LETHAL_TYPES
+from zombie_types import ZOMBIE_TYPES, ZOMBIE_TYPE_LIST, ZOMBIE_HALF_SIZES, zombie_height, spit_projectiles, zombie_deaths
 from config import *
 
+
+def _aabb(ax, ay, aw, ah, bx, by, bw, bh):
+    """Axis-aligned box overlap test, same result as Rect.colliderect without building Rects"""
+    return ax < bx + bw and ax + aw > bx and ay < by + bh and ay + ah > by
+
+
+def _first_bullet_hit(bullets, candidates, spent_bullets, x, y, width, height):
+    """
+    Find the earliest unspent bullet overlapping a hitbox
+    
+    Args:
+        bullets: List of bullet objects
+        candidates: Bullet indices from the broad phase, in any order and possibly repeated
+        spent_bullets: Indices of bullets that already hit something this frame
+        x, y, width, height: Hitbox to test
+        
+    Returns:
+        Index of the first overlapping bullet, or -1 if none
+    """
+    hit = -1
+    for i in candidates:
+        if (hit == -1 or i < hit) and i not in spent_bullets:
+            bullet = bullets[i]
+            bullet_size = bullet[6]
+            if _aabb(x, y, width, height, bullet[0], bullet[1], bullet_size[0], bullet_size[1]):
+                hit = i
+    return hit
+
+
 class EnemySystem:
     """
     Manages all enemy-related functionality including
@@ -27,6 +58,12 @@ class EnemySystem:
         
         # Player dimensions (for collision)
         self.player = player
+        
+        # Zombie hitbox (width, height) per type id, scaled from the player's size
+        self.zombie_hitboxes = tuple(
+            (player.width * zombie_type.size, player.height * zombie_type.size)
+            for zombie_type in ZOMBIE_TYPE_LIST
+        )
                 
         # Game state reference (will be set later)
         self.game_state = None
@@ -42,9 +79,16 @@ class EnemySystem:
         # Spawn rate modifier for difficulty scaling
         self.spawn_rate_multiplier = BASE_SPAWN_RATE_MULTIPLIER
         
+        # Frame clock, set once per frame from the main loop
+        self.current_time = 0
+        
     def set_game_state(self, game_state):
         """Set the game state reference to access shared data"""
         self.game_state = game_state
+    
+    def set_frame_time(self, current_time):
+        """Cache the frame's tick count so methods don't each query pygame's clock"""
+        self.current_time = current_time
         
     def spawn_zombies(self, current_environment: str, spawn_rate_multiplier: float = BASE_SPAWN_RATE_MULTIPLIER):
         """
@@ -57,11 +101,12 @@ class EnemySystem:
         if not self.game_state:
             return
             
-        for zombie_type in ZOMBIE_TYPES.values():
+        for zombie_type_id, zombie_type in enumerate(ZOMBIE_TYPE_LIST):
             # Adjust spawn rate based on difficulty
             adjusted_spawn_rate = max(1, int(zombie_type.spawn_rate / spawn_rate_multiplier))
             
-            if random.randint(1, adjusted_spawn_rate) == 1:
+            # Bernoulli roll with a 1 in adjusted_spawn_rate chance (cheaper than randint)
+            if random.random() * adjusted_spawn_rate < 1:
                 scaled_height = zombie_height * zombie_type.size
                 # Calculate y position so that the bottom of the zombie aligns with the ground
                 zombie_y = self.screen_height - scaled_height - FLOOR_HEIGHT
@@ -74,10 +119,8 @@ class EnemySystem:
                     # In building area, also spawn from the right edge
                     spawn_x = self.screen_width
                 
-                zombie_type_key = next(key for key, value in ZOMBIE_TYPES.items() if value == zombie_type)
-                
                 # Initialize new zombie with appropriate attributes
-                new_zombie = [spawn_x, zombie_y, zombie_type_key, zombie_type.health, 0, "normal"]
+                new_zombie = [spawn_x, zombie_y, zombie_type_id, zombie_type.health, 0, "normal"]
                 
                 # Add velocity components for non-crawler zombies or jumpers
                 if not zombie_type.is_crawler or zombie_type.can_jump:
@@ -93,19 +136,31 @@ class EnemySystem:
         if not self.game_state:
             return
             
-        current_time = pygame.time.get_ticks()
+        current_time = self.current_time
+        
+        # Zombies outside this band only march toward the player
+        active_x_lo = -ZOMBIE_ACTIVE_MARGIN
+        active_x_hi = self.screen_width + ZOMBIE_ACTIVE_MARGIN
         
-        for zombie in self.game_state.zombies[:]:  # Use copy of game_state zombies list
+        for zombie in self.game_state.zombies:
             # Unpack zombie data
-            zombie_x, zombie_y, zombie_type_key, health, last_action_time, state = zombie[0], zombie[1], zombie[2], zombie[3], zombie[4] if len(zombie) > 4 else 0, zombie[5] if len(zombie) > 5 else "normal"
+            zombie_x, zombie_y, zombie_type_id, health, last_action_time, state = zombie[0], zombie[1], zombie[2], zombie[3], zombie[4] if len(zombie) > 4 else 0, zombie[5] if len(zombie) > 5 else "normal"
             
             # Get zombie type properties
-            zombie_type = ZOMBIE_TYPES[zombie_type_key]
+            zombie_type = ZOMBIE_TYPE_LIST[zombie_type_id]
+            
+            # Off-screen zombies skip AI and physics until they walk back into range
+            if (zombie_x < active_x_lo or zombie_x > active_x_hi) and state != "jumping":
+                if self.game_state.player_x > zombie_x:
+                    zombie[0] += zombie_type.speed
+                else:
+                    zombie[0] -= zombie_type.speed
+                continue
             
             # Calculate distance to player using game_state player position
             dx = self.game_state.player_x - zombie_x
             dy = self.game_state.player_y - zombie_y
-            distance = ((dx ** 2) + (dy ** 2)) ** 0.5
+            distance_sq = dx * dx + dy * dy  # Compare squared distances; sqrt only when normalizing
             
             # Ensure zombie list has the required attributes
             if len(zombie) <= 4:
@@ -117,26 +172,28 @@ class EnemySystem:
                 zombie.append(0)  # Add horizontal velocity
             
             # For spitter zombies, check if they should spit
-            if zombie_type.can_spit and distance < zombie_type.spit_range and distance > 100:
+            if (zombie_type.can_spit and distance_sq > 10000 and
+                    distance_sq < zombie_type.spit_range * zombie_type.spit_range):
                 # Check cooldown
                 if current_time - last_action_time > zombie_type.spit_cooldown:
-                    # Calculate direction
-                    if distance > 0:
-                        angle = math.atan2(dy, dx)
-                        spit_x = zombie_x + 20 * math.cos(angle)  # Start a bit in front of zombie
-                        spit_y = zombie_y + 20 * math.sin(angle)
-                        
-                        # Add spit projectile: [x, y, vx, vy, damage, creation_time]
-                        spit_projectiles.append([
-                            spit_x, spit_y, 
-                            zombie_type.spit_speed * math.cos(angle),
-                            zombie_type.spit_speed * math.sin(angle),
-                            zombie_type.spit_damage,
-                            current_time
-                        ])
-                        
-                        # Update last action time
-                        zombie[4] = current_time
+                    # Unit direction toward the player (distance is at least 100 here)
+                    distance = math.sqrt(distance_sq)
+                    dir_x = dx / distance
+                    dir_y = dy / distance
+                    spit_x = zombie_x + 20 * dir_x  # Start a bit in front of zombie
+                    spit_y = zombie_y + 20 * dir_y
+                    
+                    # Add spit projectile: [x, y, vx, vy, damage, creation_time]
+                    spit_projectiles.append([
+                        spit_x, spit_y, 
+                        zombie_type.spit_speed * dir_x,
+                        zombie_type.spit_speed * dir_y,
+                        zombie_type.spit_damage,
+                        current_time
+                    ])
+                    
+                    # Update last action time
+                    zombie[4] = current_time
                     continue  # Skip movement during spitting
             
             # For leaper zombies, check if they should jump
@@ -167,12 +224,13 @@ class EnemySystem:
                 continue  # Skip normal movement calculations for jumping zombies
             
             # Normal movement based on crawler flag
-            if distance > 0:
+            if distance_sq > 0:
                 if zombie_type.is_crawler:
                     # Crawler zombies: direct movement toward player (fly/crawl)
                     # Normalize the vector and multiply by speed
-                    normalized_dx = dx / distance * zombie_type.speed
-                    normalized_dy = dy / distance * zombie_type.speed
+                    step = zombie_type.speed / math.sqrt(distance_sq)
+                    normalized_dx = dx * step
+                    normalized_dy = dy * step
                     
                     # Apply movement in both directions
                     zombie[0] += normalized_dx
@@ -199,15 +257,16 @@ class EnemySystem:
                             zombie[1] = self.screen_height - self.player.height
         
         # Move spit projectiles
-        for projectile in spit_projectiles[:]:  # Use copy to allow removal
+        for projectile in spit_projectiles:
             # Update position
             projectile[0] += projectile[2]  # x += vx
             projectile[1] += projectile[3]  # y += vy
-            
-            # Check if out of bounds
-            if (projectile[0] < 0 or projectile[0] > self.screen_width or 
-                projectile[1] < 0 or projectile[1] > self.screen_height):
-                spit_projectiles.remove(projectile)
+        
+        # Drop out of bounds projectiles in one pass
+        spit_projectiles[:] = [
+            projectile for projectile in spit_projectiles
+            if 0 <= projectile[0] <= self.screen_width and 0 <= projectile[1] <= self.screen_height
+        ]
 
     def check_player_collision(self, player_x: int, player_y: int, last_damage_time: int, damage_cooldown: int):
         """
@@ -222,47 +281,31 @@ class EnemySystem:
         Returns:
             Tuple of (should_damage, damage_amount)
         """
-        current_time = pygame.time.get_ticks()
+        current_time = self.current_time
         
         # Skip if on damage cooldown
         if current_time - last_damage_time < damage_cooldown:
             return False, 0
         
-        # Create player rectangle
-        player_rect = pygame.Rect(
-            player_x, 
-            player_y, 
-            self.player.width, 
-            self.player.height
-        )
+        # Player hitbox
+        player_width = self.player.width
+        player_height = self.player.height
         
         # Check zombie collisions
+        zombie_hitboxes = self.zombie_hitboxes
         for zombie in self.game_state.zombies:
-            zombie_type = ZOMBIE_TYPES[zombie[2]]
-            
-            # Scale zombie hitbox based on size
-            zombie_width_scaled = self.player.width * zombie_type.size
-            zombie_height_scaled = self.player.height * zombie_type.size
-            
-            zombie_rect = pygame.Rect(
-                zombie[0], 
-                zombie[1], 
-                zombie_width_scaled, 
-                zombie_height_scaled
-            )
+            zombie_width_scaled, zombie_height_scaled = zombie_hitboxes[zombie[2]]
             
             # Check player collision with zombie
-            if player_rect.colliderect(zombie_rect):
+            if _aabb(player_x, player_y, player_width, player_height,
+                     zombie[0], zombie[1], zombie_width_scaled, zombie_height_scaled):
                 self.play_hit_sound()
-                return True, zombie_type.damage
+                return True, ZOMBIE_TYPE_LIST[zombie[2]].damage
         
         # Check spit projectile collisions
-        for projectile in spit_projectiles[:]:
-            projectile_rect = pygame.Rect(
-                projectile[0] - 8, projectile[1] - 8, 16, 16
-            )
-            
-            if player_rect.colliderect(projectile_rect):
+        for projectile in spit_projectiles:
+            if _aabb(player_x, player_y, player_width, player_height,
+                     projectile[0] - 8, projectile[1] - 8, 16, 16):
                 # Remove projectile
                 spit_projectiles.remove(projectile)
                 self.play_hit_sound()
@@ -279,103 +322,113 @@ class EnemySystem:
             weapon_system: Optional WeaponSystem instance for explosion creation
             add_score_callback: Optional callback function to add score
             
+        Spent bullets are swept out of the list in place.
+        
         Returns:
-            List of bullets that should be removed
+            Number of bullets that hit a zombie
         """
-        current_time = pygame.time.get_ticks()
-        bullets_to_remove = []
+        current_time = self.current_time
+        spent_bullets = set()  # Indices of bullets that hit something this frame
+        zombies_killed = False
         
         # Early exit if no zombies or bullets
         if not self.game_state.zombies or not bullets:
-            return bullets_to_remove
+            return 0
+        
+        # Bullets are dropped once off-screen, so zombies outside this band can't be hit
+        active_x_lo = -ZOMBIE_ACTIVE_MARGIN
+        active_x_hi = self.screen_width + ZOMBIE_ACTIVE_MARGIN
+        
+        # Bucket bullets once so each zombie only tests the bullets sharing
+        # a cell with its hitbox
+        bullet_grid = SpatialHash(BULLET_GRID_SHIFT)
+        for i, bullet in enumerate(bullets):
+            bullet_size = bullet[6]
+            bullet_grid.insert_box(i, bullet[0], bullet[1], bullet_size[0], bullet_size[1])
         
-        for zombie in self.game_state.zombies[:]:  # Use copy for safe removal
-            zombie_type = ZOMBIE_TYPES[zombie[2]]
+        zombie_hitboxes = self.zombie_hitboxes
+        for zombie in self.game_state.zombies:
+            if zombie[0] < active_x_lo or zombie[0] > active_x_hi:
+                continue
             
-            # Scale zombie hitbox based on size
-            zombie_width_scaled = self.player.width * zombie_type.size
-            zombie_height_scaled = self.player.height * zombie_type.size
+            zombie_width_scaled, zombie_height_scaled = zombie_hitboxes[zombie[2]]
             
-            zombie_rect = pygame.Rect(
-                zombie[0], 
-                zombie[1], 
-                zombie_width_scaled, 
-                zombie_height_scaled
+            # Only the earliest live bullet overlapping the zombie hits it this frame
+            i = _first_bullet_hit(
+                bullets, bullet_grid.query_box(zombie[0], zombie[1], zombie_width_scaled, zombie_height_scaled),
+                spent_bullets, zombie[0], zombie[1], zombie_width_scaled, zombie_height_scaled
             )
+            if i == -1:
+                continue
             
-            # Check each bullet for collision
-            for i, bullet in enumerate(bullets):
-                if i in bullets_to_remove:
-                    continue
-                    
-                bullet_rect = pygame.Rect(
-                    bullet[0], 
-                    bullet[1], 
-                    bullet[6][0], 
-                    bullet[6][1]
-                )
+            bullet = bullets[i]
+            
+            # Apply damage based on bullet's damage value
+            damage = bullet[4]  # Use the damage value directly from the bullet
+            
+            # Play random hit-flesh sound
+            if current_time - self.last_hit_sound > self.hit_sound_cooldown:
+                # Get list of available hit flesh sounds
+                hit_sounds = [
+                    'hit-flesh-1',
+                    'hit-flesh-2',
+                    'hit-flesh-3'
+                ]
                 
-                if zombie_rect.colliderect(bullet_rect):
-                    # Apply damage based on bullet's damage value
-                    damage = bullet[4]  # Use the damage value directly from the bullet
-                    
-                    # Play random hit-flesh sound
-                    if current_time - self.last_hit_sound > self.hit_sound_cooldown:
-                        # Get list of available hit flesh sounds
-                        hit_sounds = [
-                            'hit-flesh-1',
-                            'hit-flesh-2',
-                            'hit-flesh-3'
-                        ]
-                        
-                        # Pick a random hit sound
-                        hit_sound = random.choice(hit_sounds)
-                        
-                        # Play the selected hit sound
-                        if self.channels and 'hit' in self.channels:
-                            self.channels['hit'].play(self.sound_controller.sounds[hit_sound])
-                            self.last_hit_sound = current_time
-                    
-                    # Apply damage to zombie
-                    zombie[3] -= damage
-                    
-                    # Apply knockback to zombie based on bullet momentum
-                    knockback_x = bullet[7] * 0.2
-                    knockback_y = bullet[8] * 0.2 if len(bullet) > 8 else 0
-                    
-                    # Apply knockback, but don't knock zombies through walls
-                    zombie[0] += knockback_x
-                    zombie[1] += knockback_y
-                    
-                    # Ensure zombie stays within screen bounds
-                    zombie[0] = max(0, min(zombie[0], self.screen_width - zombie_width_scaled))
-                    zombie[1] = max(0, min(zombie[1], self.screen_height - zombie_height_scaled))
-                    
-                    # Handle explosive bullets
-                    if len(bullet) > 9 and bullet[9] and weapon_system:
-                        weapon_system.create_bullet_explosion(bullet)
-                    
-                    # Add bullet to removal list
-                    bullets_to_remove.append(i)
+                # Pick a random hit sound
+                hit_sound = random.choice(hit_sounds)
+                
+                # Play the selected hit sound
+                if self.channels and 'hit' in self.channels:
+                    self.channels['hit'].play(self.sound_controller.sounds[hit_sound])
+                    self.last_hit_sound = current_time
+            
+            # Apply damage to zombie
+            zombie[3] -= damage
+            
+            # Apply knockback to zombie based on bullet momentum
+            knockback_x = bullet[7] * 0.2
+            knockback_y = bullet[8] * 0.2 if len(bullet) > 8 else 0
+            
+            # Apply knockback, but don't knock zombies through walls
+            zombie[0] += knockback_x
+            zombie[1] += knockback_y
+            
+            # Ensure zombie stays within screen bounds
+            zombie[0] = max(0, min(zombie[0], self.screen_width - zombie_width_scaled))
+            zombie[1] = max(0, min(zombie[1], self.screen_height - zombie_height_scaled))
+            
+            # Handle explosive bullets
+            if len(bullet) > 9 and bullet[9] and weapon_system:
+                weapon_system.create_bullet_explosion(bullet)
+            
+            # Mark the bullet spent; it is swept out after all zombies are checked
+            spent_bullets.add(i)
+            
+            # Check if zombie died
+            if zombie[3] <= 0:
+                # Generate death animation
+                zombie_deaths.append((
+                    zombie[0], zombie[1], current_time, 2000, zombie[2]  # 2 second death animation
+                ))
+                
+                # Mark for removal once all bullets are processed
+                zombies_killed = True
+                
+                # Add score for kill
+                if add_score_callback:
+                    add_score_callback(ZOMBIE_TYPE_LIST[zombie[2]].health)
                     
-                    # Check if zombie died
-                    if zombie[3] <= 0:
-                        # Generate death animation
-                        zombie_deaths.append([
-                            zombie[0], zombie[1], current_time, 2000, zombie[2]  # 2 second death animation
-                        ])
-                        
-                        # Remove zombie
-                        self.game_state.zombies.remove(zombie)
-                        
-                        # Add score for kill
-                        if add_score_callback:
-                            add_score_callback(zombie_type.health)
-                            
-                    # Only process one bullet hit per frame per zombie
-                    break
         
-        return bullets_to_remove
+        # Drop killed zombies in a single pass instead of a list.remove per kill
+        if zombies_killed:
+            self.game_state.zombies[:] = [zombie for zombie in self.game_state.zombies if zombie[3] > 0]
+        
+        # Sweep spent bullets in one pass
+        if spent_bullets:
+            bullets[:] = [bullet for i, bullet in enumerate(bullets) if i not in spent_bullets]
+        
+        return len(spent_bullets)
     
     def check_explosion_collisions(self, explosions: List, get_explosion_damage_func=None, add_score_callback=None):
         """
@@ -388,15 +441,42 @@ class EnemySystem:
         """
         if not self.game_state.zombies or not explosions:
             return
+        
+        zombies = self.game_state.zombies
+        zombies_killed = False
+        
+        # Build a quadtree over zombie centers so each explosion only visits
+        # the zombies inside its bounding square
+        zombie_centers = []
+        for zombie in zombies:
+            half_width, half_height = ZOMBIE_HALF_SIZES[zombie[2]]
+            zombie_centers.append((zombie[0] + half_width, zombie[1] + half_height))
+        zombie_tree = QuadNode.build(zombie_centers)
             
         # Process explosion damage
         for i, explosion in enumerate(explosions):
             explosion_type = explosion[2]
             
-            for zombie in self.game_state.zombies[:]:
-                zombie_type = ZOMBIE_TYPES[zombie[2]]
-                zombie_center_x = zombie[0] + (zombie_width * zombie_type.size) / 2
-                zombie_center_y = zombie[1] + (zombie_height * zombie_type.size) / 2
+            # Query radius matches what the damage function will accept
+            if not get_explosion_damage_func:
+                query_radius = 150
+            elif explosion_type == 'bullet_explosion':
+                query_radius = explosion[5]
+            else:
+                query_radius = LETHAL_TYPES[explosion_type].radius
+            
+            candidates = zombie_tree.query_box(
+                explosion[0] - query_radius, explosion[1] - query_radius,
+                query_radius * 2, query_radius * 2
+            )
+            
+            for zombie_index in sorted(candidates):
+                zombie = zombies[zombie_index]
+                # Skip zombies already killed by an earlier explosion
+                if zombie[3] <= 0:
+                    continue
+                
+                zombie_center_x, zombie_center_y = zombie_centers[zombie_index]
                 
                 # Calculate distance to explosion
                 distance = math.sqrt((zombie_center_x - explosion[0])**2 + (zombie_center_y - explosion[1])**2)
@@ -420,20 +500,24 @@ class EnemySystem:
                     # Check if zombie died
                     if zombie[3] <= 0:
                         # Generate death animation
-                        zombie_deaths.append([
-                            zombie[0], zombie[1], pygame.time.get_ticks(), 2000, zombie[2]  # 2 second death animation
-                        ])
+                        zombie_deaths.append((
+                            zombie[0], zombie[1], self.current_time, 2000, zombie[2]  # 2 second death animation
+                        ))
                         
-                        # Remove zombie
-                        self.game_state.zombies.remove(zombie)
+                        # Mark for removal once all explosions are processed
+                        zombies_killed = True
                         
                         # Add score for kill
                         if add_score_callback:
-                            add_score_callback(zombie_type.health)
+                            add_score_callback(ZOMBIE_TYPE_LIST[zombie[2]].health)
+        
+        # Drop killed zombies in a single pass instead of a list.remove per kill
+        if zombies_killed:
+            zombies[:] = [zombie for zombie in zombies if zombie[3] > 0]
     
     def play_hit_sound(self):
         """Play zombie hit sound"""
-        current_time = pygame.time.get_ticks()
+        current_time = self.current_time
         
         # Respect sound cooldown
         if current_time - self.last_hit_sound < self.hit_sound_cooldown:
@@ -1,10 +1,70 @@
 import pygame
 import math
-from zombie_types import ZOMBIE_TYPES, zombie_width, zombie_height, hit_sound
-from weapon_types import WEAPON_TYPES, LETHAL_TYPES
+from zombie_types import ZOMBIE_TYPE_LIST, ZOMBIE_HALF_SIZES, hit_sound
+from weapon_types import WEAPON_TYPES, LETHAL_TYPES, PELLET_OFFSETS, RELOAD_SOUNDS
+from core.spatial_hash import SpatialHash
 import random
 
 
+# Zombie spatial hash cell size as a bit shift (64px cells)
+ZOMBIE_GRID_SHIFT = 6
+
+
+def _blast_params(radius, damage):
+    """Fold a blast's radius and center damage into (radius, radius_sq, damage, falloff_per_px)"""
+    return radius, radius * radius, damage, damage / radius
+
+
+# Blast parameters for each lethal's explosion and lingering effect, folded once
+# at import so the per-frame damage pass doesn't recompute them
+LETHAL_BLAST_PARAMS = {
+    key: _blast_params(lethal_type.radius, lethal_type.damage)
+    for key, lethal_type in LETHAL_TYPES.items()
+}
+LETHAL_EFFECT_BLAST_PARAMS = {
+    key: _blast_params(lethal_type.radius, lethal_type.damage / 10)
+    for key, lethal_type in LETHAL_TYPES.items()
+}
+
+
+def _radial_damage(zombies, zombie_cx, zombie_cy, zombie_grid, blasts):
+    """Apply linear-falloff blast damage to the live zombies around each blast
+
+    Args:
+        zombies: Zombie records, indexed in step with the center lists
+        zombie_cx: Zombie center x coordinates
+        zombie_cy: Zombie center y coordinates
+        zombie_grid: Spatial hash of zombie indices built from the centers
+        blasts: (x, y, radius, radius_sq, damage, falloff_per_px) tuples,
+            damage being the value at the center
+
+    Returns:
+        List of zombies killed by the blasts
+    """
+    killed = []
+    for x, y, radius, radius_sq, damage, falloff in blasts:
+        for i in zombie_grid.query_radius(x, y, radius):
+            zombie = zombies[i]
+            # Skip zombies already killed this frame
+            if zombie[3] <= 0:
+                continue
+            
+            # Reject on the bounding box first, then range check on squared
+            # distance; only take the root for hits
+            dx = zombie_cx[i] - x
+            if dx > radius or dx < -radius:
+                continue
+            dy = zombie_cy[i] - y
+            if dy > radius or dy < -radius:
+                continue
+            distance_sq = dx * dx + dy * dy
+            if distance_sq <= radius_sq:
+                zombie[3] -= damage - math.sqrt(distance_sq) * falloff
+                if zombie[3] <= 0:
+                    killed.append(zombie)
+    return killed
+
+
 class GameMechanics:
     def __init__(self, game_state, screen_width, screen_height, player, channels=None, gravity=0.5, player_speed=4, floor_height=30):
         self.game_state = game_state
@@ -24,93 +84,104 @@ class GameMechanics:
         
         # Keyboard shooting
         self.space_pressed_last_frame = False  # Track if space was pressed last frame
+        
+        # Frame clock, set once per frame from the main loop
+        self.current_time = 0
+
+    def set_frame_time(self, current_time):
+        """Cache the frame's tick count so methods don't each query pygame's clock"""
+        self.current_time = current_time
 
     def move_player(self, keys, platforms, speed_multiplier=1.0):
+        game_state = self.game_state
         current_speed = self.player_speed * speed_multiplier
         
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            self.game_state.player_x -= current_speed
-            self.game_state.player_facing_left = True
+            game_state.player_x -= current_speed
+            game_state.player_facing_left = True
         if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            self.game_state.player_x += current_speed
-            self.game_state.player_facing_left = False
+            game_state.player_x += current_speed
+            game_state.player_facing_left = False
+
+        if (keys[pygame.K_UP] or keys[pygame.K_w]) and game_state.on_ground:
+            game_state.player_vel_y = -10  # jump_strength
+            game_state.is_jumping = True
+            game_state.on_ground = False
 
-        if (keys[pygame.K_UP] or keys[pygame.K_w]) and self.game_state.on_ground:
-            self.game_state.player_vel_y = -10  # jump_strength
-            self.game_state.is_jumping = True
-            self.game_state.on_ground = False
+        game_state.player_vel_y += self.gravity
+        game_state.player_y += game_state.player_vel_y
+        game_state.on_ground = False
 
-        self.game_state.player_vel_y += self.gravity
-        self.game_state.player_y += self.game_state.player_vel_y
-        self.game_state.on_ground = False
+        player_width = self.player.width
+        player_height = self.player.height
 
-        player_rect = pygame.Rect(
-            self.game_state.player_x,
-            self.game_state.player_y,
-            self.player.width,
-            self.player.height
-        )
+        # Only land on platforms while falling; inline AABB test instead of building a Rect per frame
+        if game_state.player_vel_y >= 0:
+            player_left = game_state.player_x
+            player_top = game_state.player_y
+            player_right = player_left + player_width
+            player_bottom = player_top + player_height
 
-        for platform in platforms:
-            if player_rect.colliderect(platform) and self.game_state.player_vel_y >= 0:
-                self.game_state.player_y = platform.top - self.player.height
-                self.game_state.player_vel_y = 0
-                self.game_state.is_jumping = False
-                self.game_state.on_ground = True
-                break
+            for platform in platforms:
+                if (player_left < platform.right and player_right > platform.left and
+                        player_top < platform.bottom and player_bottom > platform.top):
+                    game_state.player_y = platform.top - player_height
+                    game_state.player_vel_y = 0
+                    game_state.is_jumping = False
+                    game_state.on_ground = True
+                    break
 
-        ground_y = self.HEIGHT - self.player.height
-        if self.game_state.player_y >= ground_y:
-            self.game_state.player_y = ground_y
-            self.game_state.player_vel_y = 0
-            self.game_state.is_jumping = False
-            self.game_state.on_ground = True
+        ground_y = self.HEIGHT - player_height
+        if game_state.player_y >= ground_y:
+            game_state.player_y = ground_y
+            game_state.player_vel_y = 0
+            game_state.is_jumping = False
+            game_state.on_ground = True
 
-        self.game_state.player_x = max(0, min(self.WIDTH - self.player.width, self.game_state.player_x))
+        # Keep player within screen bounds
+        max_x = self.WIDTH - player_width
+        if game_state.player_x < 0:
+            game_state.player_x = 0
+        elif game_state.player_x > max_x:
+            game_state.player_x = max_x
 
     def move_bullets(self):
-        current_time = pygame.time.get_ticks()
+        # Compact surviving bullets in place and in firing order; the enemy
+        # system resolves overlapping hits by bullet order
+        bullets = self.game_state.bullets
+        write_index = 0
+        fall_step = self.gravity * 0.5
         
-        for bullet in self.game_state.bullets[:]:
+        for bullet in bullets:
             # Check if this is an explosive bullet
             is_explosive = len(bullet) > 9 and bullet[9]
             
             # Apply gravity to explosive bullets
             if is_explosive:
-                bullet[10] += self.gravity * 0.5  # Vertical velocity component
+                bullet[10] += fall_step  # Vertical velocity component
                 bullet[1] += bullet[10]  # Apply vertical velocity
             
-            # If bullet has directional angle (new mouse shooting)
-            if len(bullet) > 8 and bullet[8]:  # bullet[8] is True for directional bullets
-                if is_explosive:
-                    # Explosive projectiles move with a slight arc
-                    bullet[0] += bullet[3] * math.cos(bullet[7])
-                else:
-                    # Regular bullets move in a straight line
-                    bullet[0] += bullet[3] * math.cos(bullet[7])
-                    bullet[1] += bullet[3] * math.sin(bullet[7])
-            else:
-                # Original horizontal shooting
-                bullet[0] += bullet[3] * bullet[2] * pygame.math.Vector2(1, 0).rotate(bullet[7]).x
-                bullet[1] += bullet[3] * bullet[2] * pygame.math.Vector2(1, 0).rotate(bullet[7]).y
+            # Velocity components were fixed when the bullet was fired
+            bullet[0] += bullet[2]
+            bullet[1] += bullet[3]
             
             # Check if explosive bullet hit the ground
             if is_explosive and bullet[1] >= self.HEIGHT - 20:
                 self.create_bullet_explosion(bullet)
-                if bullet in self.game_state.bullets:
-                    self.game_state.bullets.remove(bullet)
                 continue
                 
             # Check if explosive bullet hit side boundaries
             if is_explosive and (bullet[0] > self.WIDTH or bullet[0] < 0):
                 self.create_bullet_explosion(bullet)
-                if bullet in self.game_state.bullets:
-                    self.game_state.bullets.remove(bullet)
                 continue
                 
-            # Remove regular bullets when they go offscreen
+            # Drop regular bullets when they go offscreen
             if not is_explosive and (bullet[0] > self.WIDTH or bullet[0] < 0 or bullet[1] > self.HEIGHT or bullet[1] < 0):
-                self.game_state.bullets.remove(bullet)
+                continue
+            
+            bullets[write_index] = bullet
+            write_index += 1
+        del bullets[write_index:]
 
     def try_shoot(self):
         """Attempt to shoot the current weapon, respecting fire rate limits"""
@@ -127,15 +198,15 @@ class GameMechanics:
                 
             # Decrement ammo
             self.game_state.weapon_ammo[self.game_state.current_weapon] -= 1
-            self.game_state.last_shot_time = pygame.time.get_ticks()
-            self.game_state.last_fire_time = pygame.time.get_ticks()  # Update both timers to fix shooting delay
+            self.game_state.last_shot_time = self.current_time
+            self.game_state.last_fire_time = self.current_time  # Update both timers to fix shooting delay
             
             # Get player center position (where bullets originate)
             player_center_x = self.game_state.player_x + self.player.width // 2
             player_center_y = self.game_state.player_y + self.player.height // 2
             
             # Apply damage modifier from player stats
-            modified_damage = self.game_state.get_effective_damage(weapon.damage)
+            modified_damage = weapon.damage * self.game_state.effective_damage
             
             # Special handling for grenade launcher
             is_explosive = weapon.is_explosive if hasattr(weapon, 'is_explosive') else False
@@ -159,21 +230,24 @@ class GameMechanics:
                 
             # Decrement ammo
             self.game_state.weapon_ammo[self.game_state.current_weapon] -= 1
-            self.game_state.last_shot_time = pygame.time.get_ticks()
-            self.game_state.last_fire_time = pygame.time.get_ticks()  # Update both timers to fix shooting delay
+            self.game_state.last_shot_time = self.current_time
+            self.game_state.last_fire_time = self.current_time  # Update both timers to fix shooting delay
             
             # Get player center position (where bullets originate)
             player_center_x = self.game_state.player_x + self.player.width // 2
             player_center_y = self.game_state.player_y + self.player.height // 2
             
             # Apply damage modifier from player stats
-            modified_damage = self.game_state.get_effective_damage(weapon.damage)
+            modified_damage = weapon.damage * self.game_state.effective_damage
             
             # Special handling for grenade launcher
             is_explosive = weapon.is_explosive if hasattr(weapon, 'is_explosive') else False
             explosion_radius = weapon.explosion_radius if hasattr(weapon, 'explosion_radius') else 0
             explosion_damage = weapon.explosion_damage if hasattr(weapon, 'explosion_damage') else 0
             
+            # Bullets are [x, y, vx, vy, damage, color, size, angle, is_directional] plus
+            # [is_explosive, vertical velocity, explosion radius, explosion damage] for
+            # explosives; the velocity is fixed here so move_bullets needs no trig
             if mouse_pos:
                 # Calculate angle to mouse position
                 dx = mouse_pos[0] - player_center_x
@@ -185,33 +259,40 @@ class GameMechanics:
                 
                 # For shotgun, create spread around the target angle
                 if weapon.pellets > 1:
-                    spread_angle = math.radians(20)  # Total spread in radians
-                    angle_step = spread_angle / (weapon.pellets - 1) if weapon.pellets > 1 else 0
-                    start_angle = angle - spread_angle / 2
+                    # Pellet offsets are precomputed per pellet count
+                    pellet_angles = [angle + offset for offset in PELLET_OFFSETS[weapon.pellets]]
                     
-                    for i in range(weapon.pellets):
-                        pellet_angle = start_angle + (i * angle_step)
-                        # Create directional bullet
-                        if is_explosive:
-                            # For explosive bullets, add additional parameters
-                            self.game_state.bullets.append([
-                                player_center_x, player_center_y, 1, weapon.bullet_speed,
+                    # Create directional bullets
+                    if is_explosive:
+                        # For explosive bullets, add additional parameters
+                        self.game_state.bullets.extend([
+                            [
+                                player_center_x, player_center_y,
+                                weapon.bullet_speed * math.cos(pellet_angle), 0,  # Arc comes from gravity
                                 modified_damage, weapon.bullet_color, weapon.bullet_size, 
                                 pellet_angle, True, is_explosive, 0,  # 0 is initial vertical velocity
                                 explosion_radius, explosion_damage
-                            ])
-                        else:
-                            # Regular bullets
-                            self.game_state.bullets.append([
-                                player_center_x, player_center_y, 1, weapon.bullet_speed,
+                            ]
+                            for pellet_angle in pellet_angles
+                        ])
+                    else:
+                        # Regular bullets
+                        self.game_state.bullets.extend([
+                            [
+                                player_center_x, player_center_y,
+                                weapon.bullet_speed * math.cos(pellet_angle),
+                                weapon.bullet_speed * math.sin(pellet_angle),
                                 modified_damage, weapon.bullet_color, weapon.bullet_size, pellet_angle, True
-                            ])
+                            ]
+                            for pellet_angle in pellet_angles
+                        ])
                 else:
                     # Create a single directional bullet
                     if is_explosive:
                         # For explosive bullets, add additional parameters
                         self.game_state.bullets.append([
-                            player_center_x, player_center_y, 1, weapon.bullet_speed,
+                            player_center_x, player_center_y,
+                            weapon.bullet_speed * math.cos(angle), 0,  # Arc comes from gravity
                             modified_damage, weapon.bullet_color, weapon.bullet_size, 
                             angle, True, is_explosive, 0,  # 0 is initial vertical velocity
                             explosion_radius, explosion_damage
@@ -219,7 +300,8 @@ class GameMechanics:
                     else:
                         # Regular bullets
                         self.game_state.bullets.append([
-                            player_center_x, player_center_y, 1, weapon.bullet_speed,
+                            player_center_x, player_center_y,
+                            weapon.bullet_speed * math.cos(angle), weapon.bullet_speed * math.sin(angle),
                             modified_damage, weapon.bullet_color, weapon.bullet_size, angle, True
                         ])
             else:
@@ -231,8 +313,11 @@ class GameMechanics:
                     spread = 5
                     for i in range(weapon.pellets):
                         angle = (i - (weapon.pellets - 1) / 2) * spread
+                        angle_rad = math.radians(angle)
                         self.game_state.bullets.append([
-                            player_center_x, player_center_y, direction, weapon.bullet_speed,
+                            player_center_x, player_center_y,
+                            weapon.bullet_speed * direction * math.cos(angle_rad),
+                            weapon.bullet_speed * direction * math.sin(angle_rad),
                             modified_damage, weapon.bullet_color, weapon.bullet_size, angle, False
                         ])
                 else:
@@ -240,7 +325,7 @@ class GameMechanics:
                     if is_explosive:
                         # For explosive bullets, add additional parameters
                         self.game_state.bullets.append([
-                            player_center_x, player_center_y, direction, weapon.bullet_speed,
+                            player_center_x, player_center_y, weapon.bullet_speed * direction, 0,
                             modified_damage, weapon.bullet_color, weapon.bullet_size, 
                             0, False, is_explosive, 0,  # 0 is initial vertical velocity
                             explosion_radius, explosion_damage
@@ -248,7 +333,7 @@ class GameMechanics:
                     else:
                         # Regular bullets
                         self.game_state.bullets.append([
-                            player_center_x, player_center_y, direction, weapon.bullet_speed,
+                            player_center_x, player_center_y, weapon.bullet_speed * direction, 0,
                             modified_damage, weapon.bullet_color, weapon.bullet_size, 0, False
                         ])
 
@@ -261,11 +346,11 @@ class GameMechanics:
         - mouse_buttons: Mouse button state from pygame.mouse.get_pressed()
         - mouse_pos: Current mouse position tuple (x, y)
         """
-        current_time = pygame.time.get_ticks()
+        current_time = self.current_time
         weapon = WEAPON_TYPES[self.game_state.current_weapon]
         
         # Apply fire rate modifier from player stats
-        effective_fire_rate = weapon.fire_rate / self.game_state.stats["fire_rate"]
+        effective_fire_rate = weapon.fire_rate / self.game_state.effective_fire_rate
         
         # Keyboard shooting (spacebar)
         if keys[pygame.K_SPACE]:
@@ -315,10 +400,10 @@ class GameMechanics:
     def create_bullet_explosion(self, bullet):
         """Create an explosion from a grenade launcher bullet"""
         # Add explosion effect 
-        self.game_state.explosions.append([
+        self.game_state.explosions.append((
             bullet[0], bullet[1], 'bullet_explosion',
-            pygame.time.get_ticks(), bullet[12], bullet[11]  # Last two are damage and radius
-        ])
+            self.current_time, bullet[12], bullet[11]  # Last two are damage and radius
+        ))
         
         # Play explosion sound
         if self.channels:
@@ -327,127 +412,139 @@ class GameMechanics:
             LETHAL_TYPES['grenade'].sound.play()
 
     def update_lethals(self, platforms):
-        current_time = pygame.time.get_ticks()
+        current_time = self.current_time
+        zombies_killed = False
         
-        for lethal in self.game_state.thrown_lethals[:]:
-            lethal[3] += self.gravity * 0.5
-            lethal[0] += lethal[2]
-            lethal[1] += lethal[3]
+        # Walk by index and swap-and-pop detonated lethals; their order
+        # doesn't matter, so removal doesn't need to shift the list
+        thrown_lethals = self.game_state.thrown_lethals
+        fall_step = self.gravity * 0.5
+        ground_y = self.HEIGHT - 20
+        i = 0
+        n = len(thrown_lethals)
+        while i < n:
+            lethal = thrown_lethals[i]
+            exploded = False
+            
+            # Integrate in locals and write the new state back once
+            vel_y = lethal[3] + fall_step
+            x = lethal[0] + lethal[2]
+            y = lethal[1] + vel_y
+            lethal[0] = x
+            lethal[1] = y
+            lethal[3] = vel_y
             
-            if lethal[1] >= self.HEIGHT - 20:
-                if lethal[3] > 2:
+            if y >= ground_y:
+                if vel_y > 2:
                     self.create_explosion(lethal)
-                    self.game_state.thrown_lethals.remove(lethal)
+                    exploded = True
                 else:
-                    lethal[1] = self.HEIGHT - 20
-                    lethal[3] = -lethal[3] * 0.5
+                    lethal[1] = ground_y
+                    lethal[3] = -vel_y * 0.5
             else:
-                lethal_rect = pygame.Rect(lethal[0], lethal[1], 10, 10)
-                for platform in platforms:
-                    if lethal_rect.colliderect(platform):
-                        if lethal[3] > 2:
-                            self.create_explosion(lethal)
-                            self.game_state.thrown_lethals.remove(lethal)
-                            break
-                        else:
-                            if lethal[1] < platform.top:
-                                lethal[1] = platform.top - 10
-                                lethal[3] = -lethal[3] * 0.5
-                            elif lethal[1] > platform.bottom:
-                                lethal[1] = platform.bottom
-                                lethal[3] = -lethal[3] * 0.5
-                            else:
-                                lethal[2] = -lethal[2] * 0.5
+                # Let pygame scan the platforms in C and bounce off the first hit
+                platform_index = pygame.Rect(x, y, 10, 10).collidelist(platforms)
+                if platform_index != -1:
+                    platform = platforms[platform_index]
+                    if vel_y > 2:
+                        self.create_explosion(lethal)
+                        exploded = True
+                    elif y < platform.top:
+                        lethal[1] = platform.top - 10
+                        lethal[3] = -vel_y * 0.5
+                    elif y > platform.bottom:
+                        lethal[1] = platform.bottom
+                        lethal[3] = -vel_y * 0.5
+                    else:
+                        lethal[2] = -lethal[2] * 0.5
+            
+            if exploded:
+                n -= 1
+                thrown_lethals[i] = thrown_lethals[n]
+                thrown_lethals.pop()
+            else:
+                i += 1
         
-        # Process and remove expired explosions
-        for explosion in self.game_state.explosions[:]:
-            # Determine which lethal type or special explosion we're dealing with
+        # Snapshot zombie centers into parallel lists once per frame so the
+        # explosion and effect loops below don't recompute them per blast,
+        # and bucket them in a spatial hash so each blast only visits
+        # zombies in the cells it overlaps
+        zombies = self.game_state.zombies
+        zombie_cx = []
+        zombie_cy = []
+        zombie_grid = SpatialHash(ZOMBIE_GRID_SHIFT)
+        if self.game_state.explosions or self.game_state.persistent_effects:
+            for i, zombie in enumerate(zombies):
+                half_width, half_height = ZOMBIE_HALF_SIZES[zombie[2]]
+                center_x = zombie[0] + half_width
+                center_y = zombie[1] + half_height
+                zombie_cx.append(center_x)
+                zombie_cy.append(center_y)
+                zombie_grid.insert_point(i, center_x, center_y)
+        
+        # Process expired explosions, compacting the live ones in place and
+        # in spawn order
+        explosions = self.game_state.explosions
+        write_index = 0
+        blasts = []
+        for explosion in explosions:
+            # Resolve the lethal type once per explosion; bullet explosions use
+            # grenade timing but carry their own damage and radius
             explosion_type = explosion[2]
-            
-            # Get the explosion duration based on type
             if explosion_type == 'bullet_explosion':
-                explosion_duration = LETHAL_TYPES['grenade'].explosion_duration
+                lethal_type = LETHAL_TYPES['grenade']
+                blast_params = _blast_params(explosion[5], explosion[4])
             else:
-                explosion_duration = LETHAL_TYPES[explosion_type].explosion_duration
+                lethal_type = LETHAL_TYPES[explosion_type]
+                blast_params = LETHAL_BLAST_PARAMS[explosion_type]
                 
             # Check if the explosion has expired
-            if current_time - explosion[3] > explosion_duration:
+            if current_time - explosion[3] > lethal_type.explosion_duration:
                 # For persistent effects (like Molotov), create a persistent zone
-                if explosion_type != 'bullet_explosion' and LETHAL_TYPES[explosion_type].is_persistent:
-                    # Create persistent flame effect - add to persistent_effects list if it doesn't exist
-                    if not hasattr(self.game_state, 'persistent_effects'):
-                        self.game_state.persistent_effects = []
-                    
+                if explosion_type != 'bullet_explosion' and lethal_type.is_persistent:
                     # Add the persistent effect with: x, y, type, start_time, duration, radius, damage_per_tick
-                    self.game_state.persistent_effects.append([
+                    self.game_state.persistent_effects.append((
                         explosion[0], explosion[1], explosion_type, 
-                        current_time, LETHAL_TYPES[explosion_type].persistence_time,
-                        LETHAL_TYPES[explosion_type].radius, LETHAL_TYPES[explosion_type].damage / 10
-                    ])
+                        current_time, lethal_type.persistence_time,
+                        lethal_type.radius, lethal_type.damage / 10
+                    ))
                 
-                # Remove the explosion
-                self.game_state.explosions.remove(explosion)
                 continue
             
-            # Handle explosion damage
-            explosion_damage = 0
-            explosion_radius = 0
-            
-            # Handle both thrown lethals and bullet explosions
-            if explosion_type == 'bullet_explosion':
-                explosion_damage = explosion[4]  # Custom field for bullet explosions
-                explosion_radius = explosion[5]
-            else:
-                explosion_damage = LETHAL_TYPES[explosion_type].damage
-                explosion_radius = LETHAL_TYPES[explosion_type].radius
-            
-            for zombie in self.game_state.zombies[:]:
-                zombie_type = ZOMBIE_TYPES[zombie[2]]
-                zombie_center_x = zombie[0] + (zombie_width * zombie_type.size) / 2
-                zombie_center_y = zombie[1] + (zombie_height * zombie_type.size) / 2
-                
-                distance = math.sqrt((zombie_center_x - explosion[0])**2 + (zombie_center_y - explosion[1])**2)
-                if distance <= explosion_radius:
-                    damage = explosion_damage * (1 - distance / explosion_radius)
-                    zombie[3] -= damage
-                    if zombie[3] <= 0:
-                        self.game_state.zombies.remove(zombie)
-                        self.game_state.add_score(ZOMBIE_TYPES[zombie[2]].health)
+            explosions[write_index] = explosion
+            write_index += 1
+            blasts.append((explosion[0], explosion[1]) + blast_params)
+        del explosions[write_index:]
         
-        # Process persistent effects (like fire from Molotov)
-        if hasattr(self.game_state, 'persistent_effects'):
-            for effect in self.game_state.persistent_effects[:]:
-                # Check if effect has expired
-                if current_time - effect[3] > effect[4]:
-                    self.game_state.persistent_effects.remove(effect)
-                    continue
-                
-                # Apply damage over time to zombies in the effect area
-                effect_x, effect_y = effect[0], effect[1]
-                effect_radius = effect[5]
-                damage_per_tick = effect[6]
-                
-                for zombie in self.game_state.zombies[:]:
-                    zombie_type = ZOMBIE_TYPES[zombie[2]]
-                    zombie_center_x = zombie[0] + (zombie_width * zombie_type.size) / 2
-                    zombie_center_y = zombie[1] + (zombie_height * zombie_type.size) / 2
-                    
-                    distance = math.sqrt((zombie_center_x - effect_x)**2 + (zombie_center_y - effect_y)**2)
-                    if distance <= effect_radius:
-                        # Apply damage with falloff based on distance
-                        damage = damage_per_tick * (1 - distance / effect_radius)
-                        zombie[3] -= damage
-                        
-                        if zombie[3] <= 0:
-                            self.game_state.zombies.remove(zombie)
-                            self.game_state.add_score(ZOMBIE_TYPES[zombie[2]].health)
+        # Process persistent effects (like fire from Molotov), which burn the
+        # zombies inside them every frame until they expire
+        persistent_effects = self.game_state.persistent_effects
+        write_index = 0
+        for effect in persistent_effects:
+            # Drop expired effects
+            if current_time - effect[3] > effect[4]:
+                continue
+            persistent_effects[write_index] = effect
+            write_index += 1
+            blasts.append((effect[0], effect[1]) + LETHAL_EFFECT_BLAST_PARAMS[effect[2]])
+        del persistent_effects[write_index:]
+        
+        # Apply explosion and effect damage in one batched pass
+        if blasts:
+            for zombie in _radial_damage(zombies, zombie_cx, zombie_cy, zombie_grid, blasts):
+                zombies_killed = True
+                self.game_state.add_score(ZOMBIE_TYPE_LIST[zombie[2]].health)
+        
+        # Drop killed zombies in a single pass instead of a list.remove per kill
+        if zombies_killed:
+            zombies[:] = [zombie for zombie in zombies if zombie[3] > 0]
 
     def create_explosion(self, lethal):
         # Add explosion
-        self.game_state.explosions.append([
+        self.game_state.explosions.append((
             lethal[0], lethal[1], lethal[4],
-            pygame.time.get_ticks()
-        ])
+            self.current_time
+        ))
         
         # Play explosion sound on dedicated channel
         if self.channels:
@@ -459,11 +556,11 @@ class GameMechanics:
 
     def update_weapon_state(self):
         # Handle auto-reload and manual reload
-        current_time = pygame.time.get_ticks()
+        current_time = self.current_time
         weapon = WEAPON_TYPES[self.game_state.current_weapon]
         
         # Apply reload speed modifier from player stats
-        effective_reload_time = self.game_state.get_effective_reload_time(weapon.reload_time)
+        effective_reload_time = weapon.reload_time / self.game_state.effective_reload_speed
         
         # Check if we need to reload and enough time has passed
         # This handles both auto-reload (ammo == 0) and manual reload (started by pressing R)
@@ -478,14 +575,7 @@ class GameMechanics:
                 
                 # Play reload sound if we have dedicated channels
                 if self.channels and 'reload' in self.channels:
-                    # Try to play weapon-specific reload sound
-                    try:
-                        reload_sound = pygame.mixer.Sound(f'assets/weapons/sounds/{self.game_state.current_weapon}-reload.mp3')
-                        self.channels['reload'].play(reload_sound)
-                    except:
-                        # Fallback to generic reload sound
-                        reload_sound = pygame.mixer.Sound("assets/weapons/sounds/reload.mp3")
-                        self.channels['reload'].play(reload_sound)
+                    self.channels['reload'].play(RELOAD_SOUNDS[self.game_state.current_weapon])
 
     def get_explosion_damage(self, explosion_index, distance):
         """Calculate explosion damage based on distance from center"""
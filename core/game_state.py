@@ -1,11 +1,63 @@
 import pygame
-from weapon_types import WEAPON_TYPES, LETHAL_TYPES
+from weapon_types import WEAPON_TYPES, LETHAL_TYPES, RELOAD_SOUNDS, WEAPON_MAX_AMMO
+from collections import namedtuple
 import random
 
+
+# Upgrade menu entry. Stat upgrades take their cost from GameState.stat_upgrade_costs,
+# consumables use the fixed cost here.
+Upgrade = namedtuple('Upgrade', ['name', 'icon', 'description', 'stat', 'amount', 'cost'])
+
+# Static upgrade menu schema, built once instead of per menu action
+UPGRADE_SCHEMA = (
+    Upgrade("Damage", "⚔", "Increase damage by 10%", "damage", 0.1, None),
+    Upgrade("Fire Rate", "⚡", "Increase fire rate by 10%", "fire_rate", 0.1, None),
+    Upgrade("Reload Speed", "⟳", "Reload 10% faster", "reload_speed", 0.1, None),
+    Upgrade("Move Speed", "➤", "Move 10% faster", "move_speed", 0.1, None),
+    Upgrade("Max Health", "♥", "Increase maximum health by 1", "max_health", 1, None),
+    Upgrade("Health Pack", "✚", "Restore 1 health", None, 0, 50),
+    Upgrade("Ammo Pack", "▣", "Refill current weapon", None, 0, 75),
+)
+
+# Spawn rate multiplier for each whole-percent wave completion (0-100)
+SPAWN_RATE_BY_COMPLETION = tuple(1.0 + completion / 100.0 for completion in range(101))
+
 class GameState:
+    # Fixed attribute layout; every field is assigned in __init__/reset()
+    __slots__ = (
+        'WIDTH', 'HEIGHT', 'current_time',
+        # Player state
+        'player_x', 'player_y', 'player_vel_x', 'player_vel_y', 'player_facing_left',
+        'on_ground', 'is_jumping', 'pressing_down', 'player_health',
+        # Combat state
+        'bullets', 'zombies', 'thrown_lethals', 'explosions', 'persistent_effects',
+        'spit_projectiles', 'zombie_deaths',
+        # Weapon and lethal state
+        'current_weapon', 'weapon_ammo', 'last_shot_time', 'last_fire_time',
+        'is_manually_reloading', 'current_lethal', 'lethal_ammo',
+        # Game and wave state
+        'score', 'high_score', 'paused', 'current_wave', 'wave_time', 'wave_timer',
+        'wave_start_time', 'wave_end_at', 'wave_active', 'wave_completion',
+        'wave_completion_time', 'zombies_per_wave', 'game_over', 'show_game_over',
+        'game_over_start_time',
+        'last_damage_time', 'damage_cooldown',
+        # Stats and upgrades
+        'stats', 'stat_upgrade_costs', 'stat_levels', 'show_upgrades', 'upgrade_points',
+        'selected_upgrade', 'effective_damage', 'effective_fire_rate', 'effective_reload_speed',
+        # Intermission
+        'intermission_time', 'intermission_timer', 'intermission_start_time',
+        'intermission_end', 'WAVE_INTERMISSION_MS',
+        # Environment tracking
+        'in_safe_room', 'current_environment',
+    )
+
     def __init__(self, screen_width, screen_height):
         self.WIDTH = screen_width
         self.HEIGHT = screen_height
+        
+        # Frame clock, set once per frame from the main loop
+        self.current_time = 0
+        
         self.reset()
 
     def reset(self):
@@ -58,8 +110,10 @@ class GameState:
         self.wave_time = 60  # seconds per wave
         self.wave_timer = self.wave_time * 1000  # convert to milliseconds
         self.wave_start_time = pygame.time.get_ticks()
+        self.wave_end_at = self.wave_start_time + self.wave_timer  # Deadline checked by update_wave
         self.wave_active = True
         self.wave_completion = 0
+        self.wave_completion_time = None  # Frame time wave_completion was computed for
         self.zombies_per_wave = 10
         self.game_over = False
         self.show_game_over = False  # New flag to control game over screen
@@ -77,6 +131,7 @@ class GameState:
             "move_speed": 1.0,   # Base movement speed multiplier
             "max_health": 10     # Maximum health
         }
+        self.refresh_effective_stats()
         
         # Stat upgrade costs - increases with each purchase
         self.stat_upgrade_costs = {
@@ -123,11 +178,7 @@ class GameState:
         # Increase the cost for next upgrade of this stat
         self.stat_levels[stat_name] += 1
         self.stat_upgrade_costs[stat_name] = int(self.stat_upgrade_costs[stat_name] * 1.5)
-        
-        # Update available upgrades with new costs
-        for upgrade in self.available_upgrades:
-            if upgrade.get("stat") == stat_name:
-                upgrade["cost"] = self.stat_upgrade_costs[stat_name]
+        self.refresh_effective_stats()
                 
         return True
         
@@ -140,52 +191,67 @@ class GameState:
         
     def upgrade_ammo(self):
         """Ammo refill upgrade effect"""
-        if self.weapon_ammo[self.current_weapon] < WEAPON_TYPES[self.current_weapon].max_ammo:
-            self.weapon_ammo[self.current_weapon] = WEAPON_TYPES[self.current_weapon].max_ammo
+        max_ammo = WEAPON_MAX_AMMO[self.current_weapon]
+        if self.weapon_ammo[self.current_weapon] < max_ammo:
+            self.weapon_ammo[self.current_weapon] = max_ammo
             return True
         return False
+    
+    # Consumable upgrade effects by menu name; anything else is a stat upgrade
+    CONSUMABLE_UPGRADES = {
+        "Health Pack": upgrade_health,
+        "Ammo Pack": upgrade_ammo,
+    }
+        
+    def refresh_effective_stats(self):
+        """Cache the stat multipliers used per shot; call after changing self.stats"""
+        stats = self.stats
+        self.effective_damage = stats["damage"]
+        self.effective_fire_rate = stats["fire_rate"]
+        self.effective_reload_speed = stats["reload_speed"]
         
     def get_effective_fire_rate(self, weapon_fire_rate):
         """Calculate effective fire rate based on base stat and weapon stats"""
-        return weapon_fire_rate * self.stats["fire_rate"]
+        return weapon_fire_rate * self.effective_fire_rate
     
     def get_effective_reload_time(self, weapon_reload_time):
         """Calculate effective reload time based on base stat and weapon stats"""
-        return weapon_reload_time / self.stats["reload_speed"]
+        return weapon_reload_time / self.effective_reload_speed
     
     def get_effective_damage(self, weapon_damage):
         """Calculate effective damage based on base stat and weapon stats"""
-        return weapon_damage * self.stats["damage"]
+        return weapon_damage * self.effective_damage
+        
+    def get_upgrade_cost(self, upgrade):
+        """Current cost of an upgrade: the live stat cost, or the schema's fixed cost"""
+        return self.stat_upgrade_costs.get(upgrade.stat, upgrade.cost)
+        
+    def get_upgrade_description(self, upgrade):
+        """Menu description of an upgrade, with the current value for max health"""
+        if upgrade.stat == "max_health":
+            return f"{upgrade.description} (Current: {int(self.stats['max_health'])})"
+        return upgrade.description
         
     def purchase_upgrade(self):
         """Attempt to purchase the selected upgrade"""
-        if self.selected_upgrade < 0 or self.selected_upgrade >= len(self.available_upgrades):
+        if self.selected_upgrade < 0 or self.selected_upgrade >= len(UPGRADE_SCHEMA):
             return False
             
-        upgrade = self.available_upgrades[self.selected_upgrade]
-        if self.score >= upgrade["cost"]:
-            # Check if it's a consumable upgrade that might not be needed
-            if (upgrade["name"] == "Health Pack" and self.player_health >= self.stats["max_health"]) or \
-               (upgrade["name"] == "Ammo Pack" and self.weapon_ammo[self.current_weapon] >= WEAPON_TYPES[self.current_weapon].max_ammo):
-                return False
+        upgrade = UPGRADE_SCHEMA[self.selected_upgrade]
+        if self.score >= self.get_upgrade_cost(upgrade):
+            # Consumables refuse (return False) when they wouldn't do anything
+            if upgrade.stat:
+                result = self.upgrade_stat(upgrade.stat, upgrade.amount)
+            else:
+                handler = self.CONSUMABLE_UPGRADES.get(upgrade.name)
+                result = handler(self) if handler else False
                 
-            result = upgrade["effect"]()
             if result:
-                self.score -= upgrade["cost"]
+                # Charged at the cost read after the upgrade is applied
+                self.score -= self.get_upgrade_cost(upgrade)
                 self.upgrade_points = self.score  # Update upgrade points
-                # Update the upgrades list with new costs
-                self.update_upgrade_costs()
                 return True
         return False
-    
-    def update_upgrade_costs(self):
-        """Update the costs in the available_upgrades list based on stat_upgrade_costs"""
-        for upgrade in self.available_upgrades:
-            if upgrade.get("stat") in self.stat_upgrade_costs:
-                upgrade["cost"] = self.stat_upgrade_costs[upgrade["stat"]]
-                # Also update the description for max_health
-                if upgrade["stat"] == "max_health":
-                    upgrade["description"] = f"Increase maximum health by 1 (Current: {int(self.stats['max_health'])})"
 
     def toggle_upgrades_menu(self):
         """Toggle the upgrades menu on/off"""
@@ -199,65 +265,78 @@ class GameState:
     def select_next_upgrade(self):
         """Select the next upgrade in the list (down)"""
         if self.show_upgrades:
-            self.selected_upgrade = (self.selected_upgrade + 1) % len(self.available_upgrades)
+            self.selected_upgrade = (self.selected_upgrade + 1) % len(UPGRADE_SCHEMA)
             
     def select_prev_upgrade(self):
         """Select the previous upgrade in the list (up)"""
         if self.show_upgrades:
-            self.selected_upgrade = (self.selected_upgrade - 1) % len(self.available_upgrades)
+            self.selected_upgrade = (self.selected_upgrade - 1) % len(UPGRADE_SCHEMA)
+
+    def set_frame_time(self, current_time):
+        """Cache the frame's tick count so methods don't each query pygame's clock"""
+        self.current_time = current_time
 
     def update_wave(self):
         """Update wave state including active periods and intermissions"""
         if self.game_over:
             return False
             
-        current_time = pygame.time.get_ticks()
+        current_time = self.current_time
         
         if self.wave_active:
-            # Active wave period
-            time_elapsed = current_time - self.wave_start_time
-            self.wave_completion = min(100, int((time_elapsed / self.wave_timer) * 100))
-            
-            # Calculate dynamic spawn rate based on wave completion
-            self.base_spawn_rate = 1.0 + (self.wave_completion / 100.0)
-            
-            if time_elapsed >= self.wave_timer:
+            # Active wave period; completion is derived on demand by get_wave_completion()
+            if current_time >= self.wave_end_at:
                 # Wave finished, start intermission
                 self.wave_active = False
                 self.intermission_start_time = current_time
                 self.intermission_end = current_time + self.intermission_timer
+                self.wave_completion = 100
                 # Clear any remaining zombies at end of wave
                 self.zombies.clear()
                 return False  # No wave increment yet
         else:
             # Intermission period
-            time_elapsed = current_time - self.intermission_start_time
-            
-            if time_elapsed >= self.intermission_timer:
+            if current_time >= self.intermission_end:
                 # Intermission finished, start next wave
                 self.wave_active = True
                 self.current_wave += 1
                 self.wave_start_time = current_time
+                self.wave_end_at = current_time + self.wave_timer
                 self.replenish_resources()
                 # Reset wave-specific states
                 self.wave_completion = 0
-                self.base_spawn_rate = 1.0
+                self.wave_completion_time = None
                 # Close upgrade menu if open
                 self.show_upgrades = False
                 return True  # Wave incremented
                 
         return False
 
+    def get_wave_completion(self):
+        """Percentage (0-100) of the current wave elapsed, computed at most once per frame"""
+        if not self.wave_active:
+            return self.wave_completion
+        
+        current_time = self.current_time
+        if self.wave_completion_time != current_time:
+            time_elapsed = current_time - self.wave_start_time
+            self.wave_completion = max(0, min(100, int((time_elapsed / self.wave_timer) * 100)))
+            self.wave_completion_time = current_time
+        return self.wave_completion
+
+    def get_spawn_rate(self):
+        """Dynamic spawn rate multiplier for the current wave completion"""
+        return SPAWN_RATE_BY_COMPLETION[self.get_wave_completion()]
+
     def replenish_resources(self):
         # Heal player
         self.player_health = min(self.stats["max_health"], self.player_health + 1)
         
         # Replenish ammo
-        for weapon_type in self.weapon_ammo:
-            self.weapon_ammo[weapon_type] = min(
-                WEAPON_TYPES[weapon_type].max_ammo,
-                self.weapon_ammo[weapon_type] + WEAPON_TYPES[weapon_type].max_ammo // 2
-            )
+        weapon_ammo = self.weapon_ammo
+        for weapon_type, ammo in weapon_ammo.items():
+            max_ammo = WEAPON_MAX_AMMO[weapon_type]
+            weapon_ammo[weapon_type] = min(max_ammo, ammo + max_ammo // 2)
         
         # Replenish lethals
         for lethal_type in ['grenade', 'molotov']:
@@ -271,7 +350,7 @@ class GameState:
         if self.game_over:
             return 0
             
-        current_time = pygame.time.get_ticks()
+        current_time = self.current_time
         
         if self.wave_active:
             # Time remaining in wave
@@ -301,12 +380,12 @@ class GameState:
             return True
             
         self.player_health -= damage
-        self.last_damage_time = pygame.time.get_ticks()
+        self.last_damage_time = self.current_time
         
         if self.player_health <= 0:
             self.game_over = True
             self.show_game_over = True
-            self.game_over_start_time = pygame.time.get_ticks()
+            self.game_over_start_time = self.current_time
             
             # Update high score if current score is higher
             if self.score > self.high_score:
@@ -325,7 +404,7 @@ class GameState:
             return False
             
         # Wait a short delay before allowing restart to prevent accidental key press
-        if pygame.time.get_ticks() - self.game_over_start_time < 500:  # 500ms delay
+        if self.current_time - self.game_over_start_time < 500:  # 500ms delay
             return False
             
         if keys[pygame.K_r]:  # R key to restart
@@ -339,8 +418,8 @@ class GameState:
         current_ammo = self.weapon_ammo[self.current_weapon]
         
         # Only reload if not at max capacity and not already reloading
-        current_time = pygame.time.get_ticks()
-        effective_reload_time = self.get_effective_reload_time(weapon.reload_time)
+        current_time = self.current_time
+        effective_reload_time = weapon.reload_time / self.effective_reload_speed
         
         # Check if we're already in the middle of a reload
         if current_time - self.last_shot_time < effective_reload_time:
@@ -356,14 +435,7 @@ class GameState:
         
         # Play reload sound
         if 'reload' in channels:
-            # Find the appropriate reload sound based on weapon type
-            try:
-                reload_sound = pygame.mixer.Sound(f'assets/weapons/{self.current_weapon}-reload.mp3')
-                channels['reload'].play(reload_sound)
-            except:
-                # Fallback to generic reload sound
-                reload_sound = pygame.mixer.Sound("assets/weapons/sounds/reload.mp3")
-                channels['reload'].play(reload_sound)
+            channels['reload'].play(RELOAD_SOUNDS[self.current_weapon])
         
         # Set ammo to max after a delay (handled in main game loop)
         return True 
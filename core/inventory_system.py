@@ -1,11 +1,19 @@
 import pygame
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Dict, List, Optional, Any, Callable, Tuple
 from enum import Enum, auto
 import json
 import os
 import logging
-import inspect
+import heapq
+import bisect
+from weapon_types import WEAPON_TYPES, LETHAL_TYPES, RELOAD_SOUNDS
+
+# orjson is optional; saves fall back to the standard json module without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class ItemType(Enum):
@@ -20,7 +28,7 @@ class ItemType(Enum):
     QUEST = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     """Base class for all items in the inventory system"""
     id: str
@@ -39,7 +47,7 @@ class Item:
     properties: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class WeaponItem(Item):
     """Extended item class for weapons with weapon-specific properties"""
     max_ammo: int = 0
@@ -57,7 +65,7 @@ class WeaponItem(Item):
     explosion_damage: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class LethalItem(Item):
     """Extended item class for lethal equipment with specific properties"""
     damage: float = 1.0
@@ -69,7 +77,24 @@ class LethalItem(Item):
     persistence_time: int = 0
 
 
-@dataclass
+# Quick slot list names; add_item compares QUICK_SLOT_TYPES values against these
+WEAPON_QUICK_SLOTS = 'weapon'
+LETHAL_QUICK_SLOTS = 'lethal'
+HEALING_QUICK_SLOTS = 'healing'
+
+# Sound channel names used by the inventory
+PICKUP_CHANNEL = 'pickup'
+RELOAD_CHANNEL = 'reload'
+
+# Quick slot list each item type is tracked in
+QUICK_SLOT_TYPES = {
+    ItemType.WEAPON: WEAPON_QUICK_SLOTS,
+    ItemType.LETHAL: LETHAL_QUICK_SLOTS,
+    ItemType.HEALTH: HEALING_QUICK_SLOTS,
+}
+
+
+@dataclass(slots=True)
 class InventorySlot:
     """Represents a single slot in the inventory"""
     item: Optional[Item] = None
@@ -87,52 +112,101 @@ class InventorySystem:
         self.slots = [InventorySlot() for _ in range(max_slots)]
         self.channels = channels
         
+        # Held items and equipment
+        self.reset()
+        
+        # Item database, filled from weapon_types etc. the first time each id is used
+        self.item_database = {}
+        
+        # Callbacks for item usage
+        self.use_callbacks = {}
+        
+        # Item type dispatch for add_item and use_item
+        self.add_handlers = {
+            ItemType.KEY: self.add_key,
+            ItemType.QUEST: self.add_quest_item,
+            ItemType.COLLECTIBLE: self.add_collectible,
+            ItemType.CRAFTING: self.add_crafting_material,
+        }
+        self.use_handlers = {
+            ItemType.HEALTH: self.use_health_item,
+            ItemType.AMMO: self.use_ammo_item,
+        }
+        
+        # Called after a successful reload so the owner can reset its fire timer
+        self.reload_callback = None
+        
+        # Fallback sound for items without their own, decoded once instead of per use
+        try:
+            self.pickup_sound = pygame.mixer.Sound('assets/sounds/pickup.mp3')
+        except pygame.error:
+            self.pickup_sound = None
+        
+        # Last (pretty, data) written by save_to_file, by filename, to skip unchanged saves
+        self.last_saved_data = {}
+        
+        # Debug logging
+        self.logger = logging.getLogger('inventory')
+        self.logger.setLevel(logging.INFO)
+    
+    def reset(self):
+        """Empty the inventory; the item database and registered callbacks are kept"""
+        self.reset_slots()
+        
+        # Slot lookup tables kept in step with the slots so add_item doesn't scan them
+        self.open_stacks = {}  # item id -> sorted indices of its slots with room left
+        self.empty_slots = []  # Heap of free, unlocked slot indices
+        
         # Active equipment
         self.current_weapon = None
         self.current_lethal = None
         self.quick_slots = {
-            'weapon': [],  # List of indices of weapon slots for quick switching
-            'lethal': [],  # List of indices of lethal slots for quick switching
-            'healing': []  # List of indices of healing items for quick use
+            WEAPON_QUICK_SLOTS: [],  # List of indices of weapon slots for quick switching
+            LETHAL_QUICK_SLOTS: [],  # List of indices of lethal slots for quick switching
+            HEALING_QUICK_SLOTS: []  # List of indices of healing items for quick use
         }
+        self.slot_quick_type = {}  # slot index -> the quick_slots list holding it
+        self.rebuild_slot_index()
         
         # Keys are stored separately for easy access
-        self.keys = {}
+        self.keys = set()  # Item ids only; the templates live in item_database
         
         # Collected quest items
-        self.quest_items = {}
+        self.quest_items = set()
         
         # Crafting materials
         self.crafting_materials = {}
         
         # Special collectibles (achievements, etc.)
-        self.collectibles = {}
-        
-        # Item database (populated from weapon_types, etc.)
-        self.item_database = {}
-        
-        # Callbacks for item usage
-        self.use_callbacks = {}
-        
-        # Load item database
-        self.load_item_database()
-        
-        # Debug logging
-        self.logger = logging.getLogger('inventory')
-        self.logger.setLevel(logging.INFO)
+        self.collectibles = set()
     
-    def load_item_database(self):
+    def reset_slots(self):
+        """Clear every slot in place rather than allocating a new slot list"""
+        for slot in self.slots:
+            slot.item = None
+            slot.quantity = 0
+            slot.is_locked = False
+            slot.is_equipped = False
+    
+    def get_item_template(self, item_id: str) -> Optional[Item]:
+        """Return the database template for an item id, building it on first use"""
+        template = self.item_database.get(item_id)
+        if template is None:
+            template = self.build_item_template(item_id)
+            if template is not None:
+                self.item_database[item_id] = template
+        return template
+    
+    def build_item_template(self, item_id: str) -> Optional[Item]:
         """
-        Load item database from weapon_types and lethal_types.
+        Build the template for one item from weapon_types and lethal_types.
         This could also load from a JSON file for more complex games.
         """
-        # Import here to avoid circular imports
-        from weapon_types import WEAPON_TYPES, LETHAL_TYPES
-        
-        # Load weapons
-        for weapon_id, weapon_data in WEAPON_TYPES.items():
-            self.item_database[weapon_id] = WeaponItem(
-                id=weapon_id,
+        # Weapons
+        weapon_data = WEAPON_TYPES.get(item_id)
+        if weapon_data is not None:
+            return WeaponItem(
+                id=item_id,
                 name=weapon_data.name,
                 description=f"{weapon_data.name} - {weapon_data.damage} damage",
                 item_type=ItemType.WEAPON,
@@ -153,10 +227,11 @@ class InventorySystem:
                 explosion_damage=getattr(weapon_data, 'explosion_damage', 0.0)
             )
         
-        # Load lethals
-        for lethal_id, lethal_data in LETHAL_TYPES.items():
-            self.item_database[lethal_id] = LethalItem(
-                id=lethal_id,
+        # Lethals
+        lethal_data = LETHAL_TYPES.get(item_id)
+        if lethal_data is not None:
+            return LethalItem(
+                id=item_id,
                 name=lethal_data.name,
                 description=f"{lethal_data.name} - {lethal_data.damage} damage",
                 item_type=ItemType.LETHAL,
@@ -173,182 +248,161 @@ class InventorySystem:
                 persistence_time=getattr(lethal_data, 'persistence_time', 0)
             )
         
-        # Create basic health item
-        self.item_database['health_pack'] = Item(
-            id='health_pack',
-            name='Health Pack',
-            description='Restores 1 heart of health',
-            item_type=ItemType.HEALTH,
-            max_stack=5,
-            current_stack=1,
-            properties={'heal_amount': 1}
-        )
-        
-        # Create ammo item
-        self.item_database['ammo_pack'] = Item(
-            id='ammo_pack',
-            name='Ammo Pack',
-            description='Refills current weapon ammo',
-            item_type=ItemType.AMMO,
-            max_stack=5,
-            current_stack=1,
-            properties={'ammo_amount': 'full'}
-        )
+        # Basic health item
+        if item_id == 'health_pack':
+            return Item(
+                id='health_pack',
+                name='Health Pack',
+                description='Restores 1 heart of health',
+                item_type=ItemType.HEALTH,
+                max_stack=5,
+                current_stack=1,
+                properties={'heal_amount': 1}
+            )
+        
+        # Ammo item
+        if item_id == 'ammo_pack':
+            return Item(
+                id='ammo_pack',
+                name='Ammo Pack',
+                description='Refills current weapon ammo',
+                item_type=ItemType.AMMO,
+                max_stack=5,
+                current_stack=1,
+                properties={'ammo_amount': 'full'}
+            )
+        
+        return None
     
     def add_item(self, item_id: str, quantity: int = 1) -> bool:
         """
         Add an item to the inventory
         Returns True if successfully added, False if inventory is full
         """
-        if item_id not in self.item_database:
+        item = self.get_item_template(item_id)
+        if item is None:
             self.logger.warning(f"Attempted to add unknown item: {item_id}")
             return False
         
-        item = self.item_database[item_id]
+        # Special item types are kept in their own collections instead of slots
+        handler = self.add_handlers.get(item.item_type)
+        if handler:
+            return handler(item_id, item, quantity)
         
-        # Handle special item types
-        if item.item_type == ItemType.KEY:
-            self.keys[item_id] = item
-            return True
-        
-        if item.item_type == ItemType.QUEST:
-            self.quest_items[item_id] = item
-            return True
-        
-        if item.item_type == ItemType.COLLECTIBLE:
-            self.collectibles[item_id] = item
-            return True
-        
-        if item.item_type == ItemType.CRAFTING:
-            if item_id in self.crafting_materials:
-                self.crafting_materials[item_id].current_stack += quantity
+        # For regular items, find existing stack or empty slot
+        # Every instance of an id shares the template's stack size
+        max_stack = item.max_stack
+        slots = self.slots
+        
+        # First try to stack with existing items that still have room
+        open_stacks = self.open_stacks.setdefault(item_id, [])
+        while open_stacks:
+            slot = slots[open_stacks[0]]
+            new_quantity = slot.quantity + quantity
+            if new_quantity <= max_stack:
+                slot.quantity = new_quantity
+                if new_quantity == max_stack:
+                    open_stacks.pop(0)
+                return True
             else:
-                self.crafting_materials[item_id] = item
-            return True
+                # Fill this slot and continue with remaining
+                quantity = new_quantity - max_stack
+                slot.quantity = max_stack
+                open_stacks.pop(0)
         
-        # For regular items, find existing stack or empty slot
-        # First try to stack with existing items
-        for i, slot in enumerate(self.slots):
-            if slot.item and slot.item.id == item_id and slot.quantity < slot.item.max_stack:
-                new_quantity = slot.quantity + quantity
-                if new_quantity <= slot.item.max_stack:
-                    slot.quantity = new_quantity
-                    return True
-                else:
-                    # Fill this slot and continue with remaining
-                    remaining = new_quantity - slot.item.max_stack
-                    slot.quantity = slot.item.max_stack
-                    quantity = remaining
+        # Everything fit in existing stacks; don't claim an empty slot
+        if quantity <= 0:
+            return True
         
-        # Find empty slot for remaining items
-        for i, slot in enumerate(self.slots):
-            if not slot.item and not slot.is_locked:
-                # Create a new instance of the item
-                new_item = self.create_item_instance(item_id)
-                if not new_item:
-                    return False
-                
-                slot.item = new_item
-                slot.quantity = min(quantity, new_item.max_stack)
-                
-                # Add to appropriate quick slot list if weapon or lethal
-                if new_item.item_type == ItemType.WEAPON and i not in self.quick_slots['weapon']:
-                    self.quick_slots['weapon'].append(i)
-                    # Set as current weapon if we don't have one
-                    if self.current_weapon is None:
-                        self.equip_item(i)
-                
-                elif new_item.item_type == ItemType.LETHAL and i not in self.quick_slots['lethal']:
-                    self.quick_slots['lethal'].append(i)
-                    # Set as current lethal if we don't have one
-                    if self.current_lethal is None:
-                        self.equip_item(i)
-                
-                elif new_item.item_type == ItemType.HEALTH and i not in self.quick_slots['healing']:
-                    self.quick_slots['healing'].append(i)
+        # Split the remainder into full stacks plus one partial stack up front,
+        # then fill the lowest free slots with them
+        full_stacks, leftover = divmod(quantity, max_stack)
+        stack_sizes = [max_stack] * full_stacks
+        if leftover:
+            stack_sizes.append(leftover)
+        
+        for stack_size in stack_sizes:
+            if not self.empty_slots:
+                # Inventory is full
+                return False
+            
+            # Create a new instance of the item
+            new_item = self.create_item_instance(item_id)
+            if not new_item:
+                return False
+            
+            i = heapq.heappop(self.empty_slots)
+            slot = slots[i]
+            slot.item = new_item
+            slot.quantity = stack_size
+            if stack_size < max_stack:
+                bisect.insort(open_stacks, i)
+            
+            # Add to appropriate quick slot list if weapon, lethal or healing
+            quick_type = QUICK_SLOT_TYPES.get(new_item.item_type)
+            if quick_type and i not in self.slot_quick_type:
+                self.quick_slots[quick_type].append(i)
+                self.slot_quick_type[i] = quick_type
                 
-                # If we couldn't add all items, continue with remaining
-                if quantity > new_item.max_stack:
-                    quantity -= new_item.max_stack
-                else:
-                    return True
+                # Set as current weapon or lethal if we don't have one
+                if quick_type == WEAPON_QUICK_SLOTS and self.current_weapon is None:
+                    self.equip_item(i)
+                elif quick_type == LETHAL_QUICK_SLOTS and self.current_lethal is None:
+                    self.equip_item(i)
         
-        # If we get here and quantity > 0, inventory is full
-        return quantity == 0
+        return True
+    
+    def add_key(self, item_id: str, item: Item, quantity: int) -> bool:
+        """Store a key item"""
+        self.keys.add(item_id)
+        return True
+    
+    def add_quest_item(self, item_id: str, item: Item, quantity: int) -> bool:
+        """Store a quest item"""
+        self.quest_items.add(item_id)
+        return True
+    
+    def add_collectible(self, item_id: str, item: Item, quantity: int) -> bool:
+        """Store a collectible"""
+        self.collectibles.add(item_id)
+        return True
+    
+    def add_crafting_material(self, item_id: str, item: Item, quantity: int) -> bool:
+        """Store a crafting material, stacking onto any already held"""
+        if item_id in self.crafting_materials:
+            self.crafting_materials[item_id].current_stack += quantity
+        else:
+            self.crafting_materials[item_id] = item
+        return True
+    
+    def rebuild_slot_index(self) -> None:
+        """Rebuild the open stack lists, empty slot heap and quick slot lookup"""
+        self.slot_quick_type = {
+            i: quick_type for quick_type, indices in self.quick_slots.items() for i in indices
+        }
+        self.open_stacks = {}
+        self.empty_slots = []
+        for i, slot in enumerate(self.slots):
+            if slot.item:
+                if slot.quantity < slot.item.max_stack:
+                    self.open_stacks.setdefault(slot.item.id, []).append(i)
+            elif not slot.is_locked:
+                self.empty_slots.append(i)  # Ascending, so already a valid heap
     
     def create_item_instance(self, item_id: str) -> Optional[Item]:
         """Create a new instance of an item from the database"""
-        if item_id not in self.item_database:
+        template = self.get_item_template(item_id)
+        if template is None:
             return None
         
-        # Create a deep copy of the item
-        template = self.item_database[item_id]
+        # Copy the template; properties gets its own dict so instances don't share it,
+        # and an empty one is just a fresh literal rather than a copy
+        properties = template.properties.copy() if template.properties else {}
         
-        if isinstance(template, WeaponItem):
-            return WeaponItem(
-                id=template.id,
-                name=template.name,
-                description=template.description,
-                item_type=template.item_type,
-                sprite=template.sprite,
-                sound=template.sound,
-                max_stack=template.max_stack,
-                current_stack=template.current_stack,
-                can_drop=template.can_drop,
-                can_use=template.can_use,
-                value=template.value,
-                properties=template.properties.copy(),
-                max_ammo=template.max_ammo,
-                current_ammo=template.max_ammo,  # Start with full ammo
-                damage=template.damage,
-                bullet_speed=template.bullet_speed,
-                pellets=template.pellets,
-                reload_time=template.reload_time,
-                bullet_color=template.bullet_color,
-                bullet_size=template.bullet_size,
-                is_auto=template.is_auto,
-                fire_rate=template.fire_rate,
-                is_explosive=template.is_explosive,
-                explosion_radius=template.explosion_radius,
-                explosion_damage=template.explosion_damage
-            )
-        elif isinstance(template, LethalItem):
-            return LethalItem(
-                id=template.id,
-                name=template.name,
-                description=template.description,
-                item_type=template.item_type,
-                sprite=template.sprite,
-                sound=template.sound,
-                max_stack=template.max_stack,
-                current_stack=template.current_stack,
-                can_drop=template.can_drop,
-                can_use=template.can_use,
-                value=template.value,
-                properties=template.properties.copy(),
-                damage=template.damage,
-                radius=template.radius,
-                throw_speed=template.throw_speed,
-                explosion_duration=template.explosion_duration,
-                explosion_color=template.explosion_color,
-                is_persistent=template.is_persistent,
-                persistence_time=template.persistence_time
-            )
-        else:
-            return Item(
-                id=template.id,
-                name=template.name,
-                description=template.description,
-                item_type=template.item_type,
-                sprite=template.sprite,
-                sound=template.sound,
-                max_stack=template.max_stack,
-                current_stack=template.current_stack,
-                can_drop=template.can_drop,
-                can_use=template.can_use,
-                value=template.value,
-                properties=template.properties.copy()
-            )
+        if template.item_type is ItemType.WEAPON:
+            # Start with full ammo
+            return replace(template, properties=properties, current_ammo=template.max_ammo)
+        return replace(template, properties=properties)
     
     def remove_item(self, slot_index: int, quantity: int = 1) -> bool:
         """
@@ -364,6 +418,7 @@ class InventorySystem:
             return False
         
         slot.quantity -= quantity
+        open_stacks = self.open_stacks.setdefault(slot.item.id, [])
         
         # If quantity is now 0, remove the item
         if slot.quantity <= 0:
@@ -371,13 +426,21 @@ class InventorySystem:
             if slot.is_equipped:
                 self.unequip_item(slot_index)
             
-            # Remove from quick slots if present
-            for quick_type in self.quick_slots:
-                if slot_index in self.quick_slots[quick_type]:
-                    self.quick_slots[quick_type].remove(slot_index)
+            # Remove from its quick slot list if present
+            quick_type = self.slot_quick_type.pop(slot_index, None)
+            if quick_type:
+                self.quick_slots[quick_type].remove(slot_index)
+            
+            if slot_index in open_stacks:
+                open_stacks.remove(slot_index)
             
             slot.item = None
             slot.quantity = 0
+            if not slot.is_locked:
+                heapq.heappush(self.empty_slots, slot_index)
+        elif slot_index not in open_stacks:
+            # The stack has room again
+            bisect.insort(open_stacks, slot_index)
         
         return True
     
@@ -404,32 +467,38 @@ class InventorySystem:
                 return self.remove_item(slot_index, 1)
             return False
         
-        # Default behavior for different item types
-        if item.item_type == ItemType.HEALTH:
-            # Play health sound if available
-            if self.channels and 'pickup' in self.channels:
-                self.channels['pickup'].play(item.sound if item.sound else pygame.mixer.Sound('assets/sounds/pickup.mp3'))
-            
-            # The actual health restoration will be handled by the callback
-            return self.remove_item(slot_index, 1)
-        
-        elif item.item_type == ItemType.AMMO:
-            # Only use ammo pack if current weapon needs ammo
-            if self.current_weapon is not None:
-                current_weapon = self.slots[self.current_weapon].item
-                if isinstance(current_weapon, WeaponItem) and current_weapon.current_ammo < current_weapon.max_ammo:
-                    current_weapon.current_ammo = current_weapon.max_ammo
-                    
-                    # Play reload sound
-                    if self.channels and 'reload' in self.channels:
-                        self.channels['reload'].play(pygame.mixer.Sound('assets/weapons/sounds/reload.mp3'))
-                    
-                    return self.remove_item(slot_index, 1)
-            return False
+        # Default behavior for consumable item types
+        handler = self.use_handlers.get(item.item_type)
+        if handler:
+            return handler(slot_index, item)
         
         # For weapons and lethals, equipping is handled separately
         return False
     
+    def use_health_item(self, slot_index: int, item: Item) -> bool:
+        """Consume a health item; the actual healing is handled by a registered callback"""
+        # Play health sound if available
+        sound = item.sound or self.pickup_sound
+        if sound and self.channels and PICKUP_CHANNEL in self.channels:
+            self.channels[PICKUP_CHANNEL].play(sound)
+        
+        return self.remove_item(slot_index, 1)
+    
+    def use_ammo_item(self, slot_index: int, item: Item) -> bool:
+        """Consume an ammo item to refill the equipped weapon, if it needs ammo"""
+        if self.current_weapon is not None:
+            current_weapon = self.slots[self.current_weapon].item
+            if current_weapon is not None and current_weapon.item_type is ItemType.WEAPON and current_weapon.current_ammo < current_weapon.max_ammo:
+                current_weapon.current_ammo = current_weapon.max_ammo
+                
+                # Play reload sound
+                reload_sound = RELOAD_SOUNDS.get(current_weapon.id)
+                if reload_sound and self.channels and RELOAD_CHANNEL in self.channels:
+                    self.channels[RELOAD_CHANNEL].play(reload_sound)
+                
+                return self.remove_item(slot_index, 1)
+        return False
+    
     def equip_item(self, slot_index: int) -> bool:
         """
         Equip an item (weapon or lethal)
@@ -499,21 +568,22 @@ class InventorySystem:
         Cycle to the next weapon in the quick slots
         Returns the new weapon slot index or None if no weapons
         """
-        if not self.quick_slots['weapon']:
+        quick_slots = self.quick_slots[WEAPON_QUICK_SLOTS]
+        if not quick_slots:
             return None
         
         if self.current_weapon is None:
             # If no weapon equipped, equip the first one
-            new_index = self.quick_slots['weapon'][0]
+            new_index = quick_slots[0]
         else:
             # Find the index of the current weapon in the quick slots
             try:
-                current_index = self.quick_slots['weapon'].index(self.current_weapon)
+                current_index = quick_slots.index(self.current_weapon)
                 # Get the next weapon (or loop back to the first)
-                new_index = self.quick_slots['weapon'][(current_index + 1) % len(self.quick_slots['weapon'])]
+                new_index = quick_slots[(current_index + 1) % len(quick_slots)]
             except ValueError:
                 # Current weapon not in quick slots (shouldn't happen)
-                new_index = self.quick_slots['weapon'][0]
+                new_index = quick_slots[0]
         
         # Equip the new weapon
         if self.equip_item(new_index):
@@ -526,21 +596,22 @@ class InventorySystem:
         Cycle to the next lethal in the quick slots
         Returns the new lethal slot index or None if no lethals
         """
-        if not self.quick_slots['lethal']:
+        quick_slots = self.quick_slots[LETHAL_QUICK_SLOTS]
+        if not quick_slots:
             return None
         
         if self.current_lethal is None:
             # If no lethal equipped, equip the first one
-            new_index = self.quick_slots['lethal'][0]
+            new_index = quick_slots[0]
         else:
             # Find the index of the current lethal in the quick slots
             try:
-                current_index = self.quick_slots['lethal'].index(self.current_lethal)
+                current_index = quick_slots.index(self.current_lethal)
                 # Get the next lethal (or loop back to the first)
-                new_index = self.quick_slots['lethal'][(current_index + 1) % len(self.quick_slots['lethal'])]
+                new_index = quick_slots[(current_index + 1) % len(quick_slots)]
             except ValueError:
                 # Current lethal not in quick slots (shouldn't happen)
-                new_index = self.quick_slots['lethal'][0]
+                new_index = quick_slots[0]
         
         # Equip the new lethal
         if self.equip_item(new_index):
@@ -558,7 +629,7 @@ class InventorySystem:
         
         weapon = self.slots[self.current_weapon].item
         
-        if not isinstance(weapon, WeaponItem):
+        if weapon is None or weapon.item_type is not ItemType.WEAPON:
             return False
         
         # Only reload if not at max ammo
@@ -566,20 +637,13 @@ class InventorySystem:
             weapon.current_ammo = weapon.max_ammo
             
             # Play reload sound
-            if self.channels and 'reload' in self.channels:
-                self.channels['reload'].play(pygame.mixer.Sound('assets/weapons/sounds/reload.mp3'))
+            reload_sound = RELOAD_SOUNDS.get(weapon.id)
+            if reload_sound and self.channels and RELOAD_CHANNEL in self.channels:
+                self.channels[RELOAD_CHANNEL].play(reload_sound)
             
-            # TODO: Reset last_fire_time in GameState
-            # This is a hacky solution - in a proper refactor, we would use events or callbacks
-            # to notify GameState of the reload rather than searching for global variables
-            frame = inspect.currentframe()
-            while frame:
-                if 'game_state' in frame.f_locals:
-                    # Reset the fire time to allow shooting immediately after reload
-                    game_state = frame.f_locals['game_state']
-                    game_state.last_fire_time = 0
-                    break
-                frame = frame.f_back
+            # Let the owner reset its fire timer to allow shooting immediately
+            if self.reload_callback:
+                self.reload_callback()
             
             return True
         
@@ -592,7 +656,7 @@ class InventorySystem:
         
         weapon = self.slots[self.current_weapon].item
         
-        if isinstance(weapon, WeaponItem):
+        if weapon is not None and weapon.item_type is ItemType.WEAPON:
             return weapon
         
         return None
@@ -604,7 +668,7 @@ class InventorySystem:
         
         lethal = self.slots[self.current_lethal].item
         
-        if isinstance(lethal, LethalItem):
+        if lethal is not None and lethal.item_type is ItemType.LETHAL:
             return lethal
         
         return None
@@ -624,6 +688,10 @@ class InventorySystem:
         """Register a callback function for when an item is used"""
         self.use_callbacks[item_id] = callback
     
+    def set_reload_callback(self, callback: Optional[Callable[[], None]]) -> None:
+        """Register a callback function for when the equipped weapon is reloaded"""
+        self.reload_callback = callback
+    
     def initialize_from_default(self) -> None:
         """Initialize inventory with default starting items"""
         # Add pistol
@@ -647,10 +715,10 @@ class InventorySystem:
             'slots': [],
             'current_weapon': self.current_weapon,
             'current_lethal': self.current_lethal,
-            'quick_slots': self.quick_slots,
-            'keys': list(self.keys.keys()),
-            'quest_items': list(self.quest_items.keys()),
-            'collectibles': list(self.collectibles.keys()),
+            'quick_slots': {k: list(v) for k, v in self.quick_slots.items()},
+            'keys': sorted(self.keys),
+            'quest_items': sorted(self.quest_items),
+            'collectibles': sorted(self.collectibles),
             'crafting_materials': {k: v.current_stack for k, v in self.crafting_materials.items()}
         }
         
@@ -665,7 +733,7 @@ class InventorySystem:
                 }
                 
                 # Add weapon-specific data
-                if isinstance(slot.item, WeaponItem):
+                if slot.item.item_type is ItemType.WEAPON:
                     slot_data['current_ammo'] = slot.item.current_ammo
                 
                 data['slots'].append(slot_data)
@@ -676,8 +744,8 @@ class InventorySystem:
     
     def deserialize(self, data: Dict) -> None:
         """Load inventory data from a serialized dict"""
-        # Reset inventory first
-        self.__init__(self.max_slots, self.channels)
+        # Reset inventory first; the item database doesn't need rebuilding
+        self.reset()
         
         # Load slots
         for i, slot_data in enumerate(data['slots']):
@@ -689,8 +757,9 @@ class InventorySystem:
                     self.slots[i].is_equipped = slot_data['is_equipped']
                     
                     # Set weapon-specific data
-                    if 'current_ammo' in slot_data and isinstance(self.slots[i].item, WeaponItem):
-                        self.slots[i].item.current_ammo = slot_data['current_ammo']
+                    item = self.slots[i].item
+                    if 'current_ammo' in slot_data and item is not None and item.item_type is ItemType.WEAPON:
+                        item.current_ammo = slot_data['current_ammo']
         
         # Restore equipped items
         self.current_weapon = data['current_weapon']
@@ -700,31 +769,37 @@ class InventorySystem:
         self.quick_slots = data['quick_slots']
         
         # Restore special collections
-        for key_id in data['keys']:
-            if key_id in self.item_database:
-                self.keys[key_id] = self.item_database[key_id]
-        
-        for item_id in data['quest_items']:
-            if item_id in self.item_database:
-                self.quest_items[item_id] = self.item_database[item_id]
-        
-        for item_id in data['collectibles']:
-            if item_id in self.item_database:
-                self.collectibles[item_id] = self.item_database[item_id]
+        get_item_template = self.get_item_template
+        self.keys = {key_id for key_id in data['keys'] if get_item_template(key_id)}
+        self.quest_items = {item_id for item_id in data['quest_items'] if get_item_template(item_id)}
+        self.collectibles = {item_id for item_id in data['collectibles'] if get_item_template(item_id)}
         
         for item_id, quantity in data['crafting_materials'].items():
-            if item_id in self.item_database:
-                item = self.create_item_instance(item_id)
-                if item:
-                    item.current_stack = quantity
-                    self.crafting_materials[item_id] = item
-    
-    def save_to_file(self, filename: str = 'inventory.json') -> bool:
-        """Save inventory data to a JSON file"""
+            item = self.create_item_instance(item_id)
+            if item:
+                item.current_stack = quantity
+                self.crafting_materials[item_id] = item
+        
+        # Slot flags were restored after add_item, so reindex from the slots
+        self.rebuild_slot_index()
+    
+    def save_to_file(self, filename: str = 'inventory.json', pretty: bool = False) -> bool:
+        """Save inventory data to a JSON file, indented only when pretty is set (for debugging)"""
         try:
             data = self.serialize()
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Nothing changed since the last save to this file, skip encoding and writing
+            if self.last_saved_data.get(filename) == (pretty, data) and os.path.exists(filename):
+                return True
+            if orjson:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None))
+            else:
+                with open(filename, 'w') as f:
+                    if pretty:
+                        json.dump(data, f, indent=2)
+                    else:
+                        json.dump(data, f, separators=(',', ':'))
+            self.last_saved_data[filename] = (pretty, data)
             return True
         except Exception as e:
             self.logger.error(f"Failed to save inventory: {e}")
@@ -734,8 +809,12 @@ class InventorySystem:
         """Load inventory data from a JSON file"""
         try:
             if os.path.exists(filename):
-                with open(filename, 'r') as f:
-                    data = json.load(f)
+                if orjson:
+                    with open(filename, 'rb') as f:
+                        data = orjson.loads(f.read())
+                else:
+                    with open(filename, 'r') as f:
+                        data = json.load(f)
                 self.deserialize(data)
                 return True
         except Exception as e:
@@ -1,4 +1,5 @@
 import pygame
+from types import MappingProxyType
 from typing import Dict, List, Tuple, Optional
 import math
 
@@ -15,83 +16,125 @@ from environments.swamp import SwampEnvironment
 from environments.rooftop import RooftopEnvironment
 from config import FLOOR_HEIGHT
 
+# Map colors (active, inactive) for environments missing from the color table
+DEFAULT_MAP_COLORS = ((100, 100, 100), (100, 100, 100))
+
+# Special areas that always use fixed teleport points
+FIXED_TELEPORT_AREAS = frozenset({'room', 'rooftop', 'sewer'})
+
+# Entry positions for specific (source, target) edge transitions,
+# given the screen width and the player's current Y position
+EDGE_ENTRY_RULES = {
+    # City > Apartment: appear on the left side of the apartment
+    ('city', 'apartment'): lambda width, player_y: (60, player_y),
+    # Apartment > City: appear on the right side of the city
+    ('apartment', 'city'): lambda width, player_y: (width - 60, player_y),
+}
+
+def _build_adjacency(connections):
+    """
+    Flatten a name -> neighbours mapping into integer adjacency arrays
+    
+    Returns (names, ids, offsets, neighbours): node i's neighbour ids are
+    neighbours[offsets[i]:offsets[i + 1]].
+    """
+    names = tuple(connections)
+    ids = {name: node_id for node_id, name in enumerate(names)}
+    offsets = [0]
+    neighbours = []
+    for name in names:
+        neighbours.extend(ids[target] for target in connections[name])
+        offsets.append(len(neighbours))
+    return names, MappingProxyType(ids), tuple(offsets), tuple(neighbours)
+
 class WorldMap:
     """Centralized definition of the game world structure and connections"""
-    def __init__(self):
-        # Define environment connections as a graph
-        self.connections = {
-            'city': ['apartment'],
-            'apartment': ['city', 'start', 'rooftop'],
-            'start': ['apartment', 'streets', 'room'],
-            'streets': ['start', 'forest', 'sewer'],
-            'forest': ['streets', 'lake'],
-            'lake': ['forest', 'swamp'],
-            'swamp': ['lake'],
-            'room': ['start'],
-            'rooftop': ['apartment'],
-            'sewer': ['streets']
-        }
-        
-        # Define positions for the map visualization
-        # Format: (horizontal_position, vertical_position, is_main_path)
-        # horizontal_position: 0-6 (left to right)
-        # vertical_position: 0=top, 1=middle, 2=bottom
-        # is_main_path: True if on the main horizontal path
-        self.map_positions = {
-            'city': (0, 1, True),
-            'apartment': (1, 1, True),
-            'start': (2, 1, True),
-            'streets': (3, 1, True),
-            'forest': (4, 1, True),
-            'lake': (5, 1, True),
-            'swamp': (6, 1, True),
-            'rooftop': (1, 0, False),
-            'room': (2, 0, False),
-            'sewer': (3, 2, False)
-        }
-        
-        # Define environment colors for the map
-        self.map_colors = {
-            'city': [(120, 70, 70), (90, 70, 70)],  # active, inactive
-            'apartment': [(70, 70, 120), (70, 70, 90)],
-            'start': [(70, 70, 120), (70, 70, 90)],
-            'streets': [(80, 80, 80), (60, 60, 60)],
-            'forest': [(70, 120, 70), (50, 90, 50)],
-            'lake': [(70, 70, 180), (50, 50, 150)],
-            'swamp': [(100, 120, 70), (70, 90, 50)],
-            'rooftop': [(100, 120, 120), (80, 90, 90)],
-            'room': [(120, 100, 50), (90, 80, 50)],
-            'sewer': [(70, 90, 100), (60, 70, 80)]
-        }
+    # The world layout is fixed, so these tables are built once and shared
+    # (read-only) by every instance
+    
+    # Define environment connections as a graph, in display order
+    _CONNECTIONS_ORDERED = MappingProxyType({
+        'city': ('apartment',),
+        'apartment': ('city', 'start', 'rooftop'),
+        'start': ('apartment', 'streets', 'room'),
+        'streets': ('start', 'forest', 'sewer'),
+        'forest': ('streets', 'lake'),
+        'lake': ('forest', 'swamp'),
+        'swamp': ('lake',),
+        'room': ('start',),
+        'rooftop': ('apartment',),
+        'sewer': ('streets',)
+    })
+    
+    # Frozensets for constant-time adjacency checks
+    CONNECTIONS = MappingProxyType({
+        name: frozenset(targets) for name, targets in _CONNECTIONS_ORDERED.items()
+    })
+    
+    # Define positions for the map visualization
+    # Format: (horizontal_position, vertical_position, is_main_path)
+    # horizontal_position: 0-6 (left to right)
+    # vertical_position: 0=top, 1=middle, 2=bottom
+    # is_main_path: True if on the main horizontal path
+    MAP_POSITIONS = MappingProxyType({
+        'city': (0, 1, True),
+        'apartment': (1, 1, True),
+        'start': (2, 1, True),
+        'streets': (3, 1, True),
+        'forest': (4, 1, True),
+        'lake': (5, 1, True),
+        'swamp': (6, 1, True),
+        'rooftop': (1, 0, False),
+        'room': (2, 0, False),
+        'sewer': (3, 2, False)
+    })
+    
+    # Define environment colors for the map
+    MAP_COLORS = MappingProxyType({
+        'city': ((120, 70, 70), (90, 70, 70)),  # active, inactive
+        'apartment': ((70, 70, 120), (70, 70, 90)),
+        'start': ((70, 70, 120), (70, 70, 90)),
+        'streets': ((80, 80, 80), (60, 60, 60)),
+        'forest': ((70, 120, 70), (50, 90, 50)),
+        'lake': ((70, 70, 180), (50, 50, 150)),
+        'swamp': ((100, 120, 70), (70, 90, 50)),
+        'rooftop': ((100, 120, 120), (80, 90, 90)),
+        'room': ((120, 100, 50), (90, 80, 50)),
+        'sewer': ((70, 90, 100), (60, 70, 80))
+    })
+    
+    # Integer ids and flattened adjacency for graph traversal by id
+    ENV_NAMES, ENV_IDS, _ADJ_IDX, _ADJ_DATA = _build_adjacency(_CONNECTIONS_ORDERED)
+    
+    # Instance-style names the UI reads the tables through
+    connections = CONNECTIONS
+    map_positions = MAP_POSITIONS
+    map_colors = MAP_COLORS
     
     def get_connections(self, environment_name):
         """Get all environments connected to the specified environment"""
-        if environment_name in self.connections:
-            return self.connections[environment_name]
-        return []
+        return WorldMap._CONNECTIONS_ORDERED.get(environment_name, ())
+    
+    def get_environment_id(self, environment_name):
+        """Get the integer id of an environment, or -1 if it is not on the map"""
+        return WorldMap.ENV_IDS.get(environment_name, -1)
+    
+    def get_connections_by_id(self, environment_id):
+        """Get the ids of all environments connected to the given environment id"""
+        adj_idx = WorldMap._ADJ_IDX
+        return WorldMap._ADJ_DATA[adj_idx[environment_id]:adj_idx[environment_id + 1]]
     
     def get_position(self, environment_name):
         """Get the map position for an environment"""
-        if environment_name in self.map_positions:
-            return self.map_positions[environment_name]
-        return (0, 0, False)
+        return WorldMap.MAP_POSITIONS.get(environment_name, (0, 0, False))
     
     def get_color(self, environment_name, is_active=False):
         """Get the color for an environment on the map"""
-        if environment_name in self.map_colors:
-            return self.map_colors[environment_name][0 if is_active else 1]
-        return (100, 100, 100)  # default color
+        return WorldMap.MAP_COLORS.get(environment_name, DEFAULT_MAP_COLORS)[0 if is_active else 1]
     
     def is_connected(self, source, target):
         """Check if two environments are directly connected"""
-        if source in self.connections:
-            return target in self.connections[source]
-        return False
-    
-    def draw_map(self, screen, x, y, width, height, current_env):
-        """Draw the minimap at the specified position with the current environment highlighted"""
-        # Drawing happens in UI class - this is just for reference
-        pass
+        return target in WorldMap.CONNECTIONS.get(source, ())
 
 class EnvironmentManager:
     """Manages all game environments and transitions between them"""
@@ -100,6 +143,8 @@ class EnvironmentManager:
         self.height = height
         self.channels = channels
         self.environments = {}
+        self._env_names = ()
+        self._swamp_env = None
         self.current_environment = None
         self.transition_cooldown = 0
         
@@ -107,6 +152,9 @@ class EnvironmentManager:
         self.transition_text = None
         self.transition_start_time = 0
         
+        # Frame clock, set once per frame from the main loop
+        self.current_time = 0
+        
         # Create the world map
         self.world_map = WorldMap()
         
@@ -191,9 +239,19 @@ class EnvironmentManager:
             assets
         )
         
+        # Environment names in load order, for switching by index
+        self._env_names = tuple(self.environments)
+        
+        # The swamp is the only environment with sinking platforms
+        self._swamp_env = self.environments['swamp']
+        
         # Set default environment
         self.current_environment = self.environments['start']
     
+    def set_frame_time(self, current_time: int) -> None:
+        """Cache the frame's tick count so methods don't each query pygame's clock"""
+        self.current_time = current_time
+    
     def get_current_environment(self) -> Environment:
         """Get the current active environment"""
         return self.current_environment
@@ -227,15 +285,14 @@ class EnvironmentManager:
             
             # Set transition text and start time for UI display
             self.transition_text = f"Entering {target_env.name.capitalize()}"
-            self.transition_start_time = pygame.time.get_ticks()
+            self.transition_start_time = self.current_time
             
-            # Change music
-            self.channels['music'].stop()
-            pygame.time.delay(100)  # Brief delay
+            # Change music; playing on the channel replaces the old track, so
+            # fade the new one in instead of blocking the frame between them
             print(self.channels['music'])
             print(target_env.music)
             
-            self.channels['music'].play(target_env.music, loops=-1)
+            self.channels['music'].play(target_env.music, loops=-1, fade_ms=100)
             
             # Set as current environment
             self.current_environment = target_env
@@ -244,14 +301,13 @@ class EnvironmentManager:
             self.transition_cooldown = 30  # frames
             
             # Check if door has a specific transition point defined
-            if door_obj and door_obj.get_transition_point():
-                return door_obj.get_transition_point()
-            
-            # Special areas that always use fixed teleport points
-            fixed_teleport_areas = ['room', 'rooftop', 'sewer']
+            if door_obj:
+                transition_point = door_obj.get_transition_point()
+                if transition_point:
+                    return transition_point
             
             # Determine entry position based on context
-            if environment_name in fixed_teleport_areas:
+            if environment_name in FIXED_TELEPORT_AREAS:
                 # Always use fixed entry points for special areas
                 return target_env.entry_position
             elif player_rect and source_env_name:
@@ -260,13 +316,10 @@ class EnvironmentManager:
                 # Preserve player's Y position for horizontal transitions
                 player_y = player_rect.y
                 
-                # Special case: City > Apartment (should appear on left side)
-                if source_env_name == 'city' and environment_name == 'apartment':
-                    return (60, player_y)  # Place player on left side of apartment
-                
-                # Special case: Apartment > City (should appear on right side)
-                elif source_env_name == 'apartment' and environment_name == 'city':
-                    return (self.width - 60, player_y)  # Place player on right side of city
+                # Special cases with a fixed side for this pair of areas
+                edge_rule = EDGE_ENTRY_RULES.get((source_env_name, environment_name))
+                if edge_rule:
+                    return edge_rule(self.width, player_y)
                 
                 # Coming from right edge to left edge of next area
                 elif player_rect.x >= self.width - 20:
@@ -286,17 +339,21 @@ class EnvironmentManager:
     
     def update(self) -> None:
         """Update environment state and cooldowns"""
+        current_time = self.current_time
+        cooldown = self.transition_cooldown
+        environment = self.current_environment
+        
         # Update transition cooldown
-        if self.transition_cooldown > 0:
-            self.transition_cooldown -= 1
+        if cooldown > 0:
+            self.transition_cooldown = cooldown - 1
         
         # Clear transition text after 3 seconds
-        if self.transition_text and pygame.time.get_ticks() - self.transition_start_time > 3000:
+        if self.transition_text and current_time - self.transition_start_time > 3000:
             self.transition_text = None
         
         # Update current environment
-        if self.current_environment:
-            self.current_environment.update(pygame.time.get_ticks())
+        if environment is not None:
+            environment.update(current_time)
     
     def check_door_collision(self, player_rect: pygame.Rect) -> Optional[tuple]:
         """
@@ -306,10 +363,11 @@ class EnvironmentManager:
         if not self.current_environment:
             return None
         
-        for obj in self.current_environment.objects:
-            if obj.type == 'door' and player_rect.colliderect(obj.rect):
-                if 'target_environment' in obj.properties:
-                    return (obj.properties['target_environment'], obj)
+        doors, door_rects = self.current_environment.get_object_bucket('door')
+        for index in player_rect.collidelistall(door_rects):
+            obj = doors[index]
+            if 'target_environment' in obj.properties:
+                return (obj.properties['target_environment'], obj)
         
         return None
     
@@ -321,10 +379,11 @@ class EnvironmentManager:
         if not self.current_environment:
             return None
         
-        for obj in self.current_environment.objects:
-            if obj.type == 'hazard' and player_rect.colliderect(obj.rect):
-                if 'damage' in obj.properties:
-                    return obj.properties['damage']
+        hazards, hazard_rects = self.current_environment.get_object_bucket('hazard')
+        for index in player_rect.collidelistall(hazard_rects):
+            obj = hazards[index]
+            if 'damage' in obj.properties:
+                return obj.properties['damage']
         
         return None
     
@@ -336,23 +395,25 @@ class EnvironmentManager:
         if not self.current_environment:
             return None
         
-        for obj in self.current_environment.objects:
-            if obj.type == 'item' and obj.is_available and player_rect.colliderect(obj.rect):
+        items, item_rects = self.current_environment.get_object_bucket('item')
+        for index in player_rect.collidelistall(item_rects):
+            obj = items[index]
+            if obj.is_available:
                 return obj
         
         return None
     
     def handle_item_interaction(self, obj: MapObject) -> None:
         """Process an item interaction (mark as used, start cooldown)"""
-        current_time = pygame.time.get_ticks()
         obj.is_available = False
-        obj.cooldown_time = current_time + obj.cooldown_duration
+        obj.cooldown_time = self.current_time + obj.cooldown_duration
     
     def handle_platform_collisions(self, player_rect: pygame.Rect) -> None:
         """Handle special platform behaviors like sinking platforms"""
         # Check for swamp's sinking platforms
-        if self.current_environment and self.current_environment.name == 'swamp':
-            self.current_environment.check_player_on_platform(player_rect)
+        swamp_env = self._swamp_env
+        if swamp_env is not None and self.current_environment is swamp_env:
+            swamp_env.check_player_on_platform(player_rect)
 
     def switch_environment(self, index):
         """
@@ -361,7 +422,7 @@ class EnvironmentManager:
         Returns the new environment and triggers enemy despawn
         """
         # Get the environment name string from the index
-        env_name = list(self.environments.keys())[index]
+        env_name = self._env_names[index]
         
         # If switching to Room environment, fade out horde sound
         if env_name == 'room':  # Room environment
@@ -376,7 +437,7 @@ class EnvironmentManager:
         
         # Set transition text and start time for UI display
         self.transition_text = f"Entering {self.current_environment.name.capitalize()}"
-        self.transition_start_time = pygame.time.get_ticks()
+        self.transition_start_time = self.current_time
         
         # Set cooldown to prevent immediate transition back
         self.transition_cooldown = 30  # frames
@@ -1,15 +1,35 @@
 import pygame
+from pygame.locals import K_LEFT, K_RIGHT, K_UP, K_a, K_d, K_w
 import math
 from typing import Dict, List, Tuple, Optional, Set
 
 from config import *
 
+# Airborne sprite keys, indexed by whether the player is falling
+AIRBORNE_SPRITES = ("jump", "fall")
+
 
 class Player:
     """
     Encapsulates all player-related functionality including movement,
     stats, health, and sprite rendering.
     """
+    # Fixed attribute layout; every field is assigned in __init__
+    __slots__ = (
+        'width', 'height', 'sprite', 'screen_width', 'screen_height',
+        # Physics properties
+        'gravity', 'base_speed', 'jump_strength',
+        # Position and movement
+        'x', 'y', 'vel_y', 'facing_left', 'is_jumping', 'on_ground', 'pressing_down',
+        # Health and damage system
+        'health', 'last_damage_time', 'damage_cooldown',
+        # Stats and progression
+        'stats', 'stat_levels', 'stat_upgrade_costs',
+        'effective_damage', 'effective_fire_rate', 'effective_reload_speed',
+        # Animation and sprites
+        'animation_frame', 'animation_counter', 'animation_cooldown', 'sprites',
+        'sprites_left', '_rect',
+    )
     
     def __init__(self, 
                  screen_width: int, 
@@ -43,6 +63,9 @@ class Player:
         self.on_ground = True
         self.pressing_down = False  # Track downward key for double-tap jump down
         
+        # Collision rectangle reused by get_rect
+        self._rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        
         # Health and damage system
         self.health = max_health
         self.last_damage_time = 0
@@ -56,6 +79,7 @@ class Player:
             "move_speed": 1.0,   # Base movement speed multiplier
             "max_health": max_health  # Maximum health
         }
+        self.refresh_effective_stats()
         
         # Stat upgrade levels and costs
         self.stat_levels = {
@@ -86,6 +110,14 @@ class Player:
             "jump": None,
             "fall": None
         }
+        
+        # Mirrored copies of the sprites, used while facing left
+        self.sprites_left = {
+            "idle": None,
+            "walk": [],
+            "jump": None,
+            "fall": None
+        }
     
     def load_sprites(self, 
                      idle_sprite=None, 
@@ -97,10 +129,27 @@ class Player:
         self.sprites["walk"] = walking_frames if walking_frames else []
         self.sprites["jump"] = jump_sprite
         self.sprites["fall"] = fall_sprite
+        
+        # Flip every sprite once here rather than on each draw
+        def flip(sprite):
+            return pygame.transform.flip(sprite, True, False) if sprite else None
+        
+        self.sprites_left["idle"] = flip(idle_sprite)
+        self.sprites_left["walk"] = [flip(frame) for frame in self.sprites["walk"]]
+        self.sprites_left["jump"] = flip(jump_sprite)
+        self.sprites_left["fall"] = flip(fall_sprite)
     
     def get_rect(self) -> pygame.Rect:
-        """Get the player's collision rectangle"""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        """
+        Get the player's collision rectangle
+        
+        The same Rect is updated and returned on every call, so callers
+        should not hold on to it across frames.
+        """
+        rect = self._rect
+        rect.x = int(self.x)
+        rect.y = int(self.y)
+        return rect
     
     def move(self, keys, platforms, speed_multiplier: float = 1.0):
         """
@@ -114,16 +163,21 @@ class Player:
         # Calculate current speed with all multipliers
         current_speed = self.base_speed * self.stats["move_speed"] * speed_multiplier
         
-        # Left/Right movement
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            self.x -= current_speed
-            self.facing_left = True
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            self.x += current_speed
+        # Read each direction once from the key state
+        left = keys[K_LEFT] or keys[K_a]
+        right = keys[K_RIGHT] or keys[K_d]
+        
+        # Left/Right movement; holding both cancels out but faces right
+        dx = (right - left) * current_speed
+        if dx:
+            self.x += dx
+        if right:
             self.facing_left = False
+        elif left:
+            self.facing_left = True
 
         # Jump
-        if (keys[pygame.K_UP] or keys[pygame.K_w]) and self.on_ground:
+        if (keys[K_UP] or keys[K_w]) and self.on_ground:
             self.vel_y = -self.jump_strength
             self.is_jumping = True
             self.on_ground = False
@@ -133,15 +187,15 @@ class Player:
         self.y += self.vel_y
         self.on_ground = False
 
-        # Check platform collisions
-        player_rect = self.get_rect()
-        for platform in platforms:
-            if player_rect.colliderect(platform) and self.vel_y >= 0:
-                self.y = platform.top - self.height
+        # Check platform collisions (only landing while falling); when several
+        # platforms overlap the player, land on the highest one
+        if self.vel_y >= 0:
+            hits = self.get_rect().collidelistall(platforms)
+            if hits:
+                self.y = min([platforms[index].top for index in hits]) - self.height
                 self.vel_y = 0
                 self.is_jumping = False
                 self.on_ground = True
-                break
 
         # Check ground collision
         ground_y = self.screen_height - self.height
@@ -156,45 +210,44 @@ class Player:
     
     def draw(self, screen):
         """Draw the player with appropriate animation frame"""
-        current_frame = None
+        # Pick the pre-flipped set when facing left
+        sprites = self.sprites_left if self.facing_left else self.sprites
         
         # Determine which sprite to use based on state
         if not self.on_ground:
-            if self.vel_y > 0:  # Falling
-                current_frame = self.sprites["fall"]
-            else:  # Rising
-                current_frame = self.sprites["jump"]
+            # Rising or falling
+            current_frame = sprites[AIRBORNE_SPRITES[self.vel_y > 0]]
         else:
             # Walking or idle
-            if self.sprites["walk"]:
+            walk_frames = sprites["walk"]
+            if walk_frames:
                 self.animation_counter += 1
                 if self.animation_counter >= self.animation_cooldown:
                     self.animation_counter = 0
-                    self.animation_frame = (self.animation_frame + 1) % len(self.sprites["walk"])
-                current_frame = self.sprites["walk"][self.animation_frame]
+                    self.animation_frame = (self.animation_frame + 1) % len(walk_frames)
+                current_frame = walk_frames[self.animation_frame]
             else:
-                current_frame = self.sprites["idle"]
+                current_frame = sprites["idle"]
                 
-        # Flip image if player is facing left
         if current_frame:
-            if self.facing_left:
-                current_frame = pygame.transform.flip(current_frame, True, False)
             screen.blit(current_frame, (self.x, self.y))
         else:
             # Fallback to rectangle if no images provided
             pygame.draw.rect(screen, (0, 255, 0), (self.x, self.y, self.width, self.height))
     
-    def take_damage(self, damage) -> bool:
+    def take_damage(self, damage, current_time: Optional[int] = None) -> bool:
         """
         Apply damage to the player
         
         Args:
             damage: Amount of damage to apply
+            current_time: The frame's tick count, queried from pygame if omitted
             
         Returns:
             bool: True if player died, False otherwise
         """
-        current_time = pygame.time.get_ticks()
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
         
         # Check damage cooldown
         if current_time - self.last_damage_time < self.damage_cooldown:
@@ -242,20 +295,28 @@ class Player:
         # Increase the cost for next upgrade of this stat
         self.stat_levels[stat_name] += 1
         self.stat_upgrade_costs[stat_name] = int(self.stat_upgrade_costs[stat_name] * 1.5)
+        self.refresh_effective_stats()
         
         return True
     
+    def refresh_effective_stats(self):
+        """Cache the stat multipliers used per shot; call after changing self.stats"""
+        stats = self.stats
+        self.effective_damage = stats["damage"]
+        self.effective_fire_rate = stats["fire_rate"]
+        self.effective_reload_speed = stats["reload_speed"]
+    
     def get_effective_damage(self, base_damage):
         """Apply player's damage multiplier to a base damage value"""
-        return base_damage * self.stats["damage"]
+        return base_damage * self.effective_damage
     
     def get_effective_fire_rate(self, base_fire_rate):
         """Apply player's fire rate multiplier to a base fire rate"""
-        return base_fire_rate * self.stats["fire_rate"]
+        return base_fire_rate * self.effective_fire_rate
     
     def get_effective_reload_time(self, base_reload_time):
         """Apply player's reload speed multiplier to a base reload time"""
-        return base_reload_time / self.stats["reload_speed"]
+        return base_reload_time / self.effective_reload_speed
     
     def reset(self):
         """Reset player to initial state"""
@@ -277,6 +338,7 @@ class Player:
             "move_speed": 1.0,
             "max_health": max_health  # Keep max health
         }
+        self.refresh_effective_stats()
         
         # Reset upgrade levels and costs
         self.stat_levels = {stat: 0 for stat in self.stat_levels}
@@ -328,6 +390,7 @@ class Player:
             
         if "stats" in data:
             self.stats = data["stats"]
+            self.refresh_effective_stats()
             
         if "stat_levels" in data:
             self.stat_levels = data["stat_levels"]
@@ -0,0 +1,114 @@
+# Leaves split once they hold more than this many points
+QUADTREE_LEAF_CAPACITY = 4
+
+# Stop splitting past this depth so stacked points can't recurse forever
+QUADTREE_MAX_DEPTH = 8
+
+
+class QuadNode:
+    """
+    Point quadtree node for broad-phase box queries. Items are
+    (index, x, y) tuples; leaves split into four quadrants once
+    they exceed QUADTREE_LEAF_CAPACITY.
+    """
+
+    def __init__(self, x: float, y: float, width: float, height: float, depth: int = 0):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.depth = depth
+        self.items = []
+        self.children = None
+
+    @classmethod
+    def build(cls, points):
+        """
+        Build a tree covering a list of (x, y) points, keyed by list index
+
+        Args:
+            points: List of (x, y) positions
+
+        Returns:
+            Root QuadNode, or None if there are no points
+        """
+        if not points:
+            return None
+
+        min_x = min(point[0] for point in points)
+        min_y = min(point[1] for point in points)
+        max_x = max(point[0] for point in points)
+        max_y = max(point[1] for point in points)
+        root = cls(min_x, min_y, max_x - min_x, max_y - min_y)
+        for index, (x, y) in enumerate(points):
+            root.insert(index, x, y)
+        return root
+
+    def insert(self, index: int, x: float, y: float):
+        """Insert a point item, splitting this leaf if it gets too full"""
+        node = self
+        while node.children is not None:
+            node = node._child_for(x, y)
+
+        node.items.append((index, x, y))
+        if len(node.items) > QUADTREE_LEAF_CAPACITY and node.depth < QUADTREE_MAX_DEPTH:
+            node._split()
+
+    def query_box(self, x: float, y: float, width: float, height: float, found=None):
+        """
+        Collect the indices of all points inside a box
+
+        Args:
+            x, y, width, height: Query box
+            found: Optional list to append results to
+
+        Returns:
+            List of matching item indices
+        """
+        if found is None:
+            found = []
+
+        right = x + width
+        bottom = y + height
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            # Prune nodes whose bounds miss the query box
+            if (node.x > right or node.x + node.width < x or
+                    node.y > bottom or node.y + node.height < y):
+                continue
+
+            if node.children is not None:
+                stack.extend(node.children)
+                continue
+
+            for index, item_x, item_y in node.items:
+                if x <= item_x <= right and y <= item_y <= bottom:
+                    found.append(index)
+        return found
+
+    def _child_for(self, x: float, y: float):
+        """Return the quadrant child a point falls in"""
+        quadrant = 0
+        if x >= self.x + self.width / 2:
+            quadrant += 1
+        if y >= self.y + self.height / 2:
+            quadrant += 2
+        return self.children[quadrant]
+
+    def _split(self):
+        """Turn this leaf into four quadrants and push its items down"""
+        half_width = self.width / 2
+        half_height = self.height / 2
+        depth = self.depth + 1
+        self.children = [
+            QuadNode(self.x, self.y, half_width, half_height, depth),
+            QuadNode(self.x + half_width, self.y, half_width, half_height, depth),
+            QuadNode(self.x, self.y + half_height, half_width, half_height, depth),
+            QuadNode(self.x + half_width, self.y + half_height, half_width, half_height, depth),
+        ]
+
+        items = self.items
+        self.items = []
+        for index, x, y in items:
+            self._child_for(x, y).insert(index, x, y)
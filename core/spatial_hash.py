@@ -0,0 +1,50 @@
+class SpatialHash:
+    """
+    Uniform grid that buckets item indices by cell for broad-phase
+    collision queries. Rebuilt every frame by its owner; cells are
+    2 ** cell_shift pixels square.
+    """
+
+    def __init__(self, cell_shift: int = 6):
+        self.cell_shift = cell_shift
+        self.cells = {}
+
+    def insert_point(self, index: int, x: float, y: float):
+        """Bucket an item in the cell containing a point"""
+        shift = self.cell_shift
+        cell = (int(x) >> shift, int(y) >> shift)
+        bucket = self.cells.get(cell)
+        if bucket is None:
+            self.cells[cell] = [index]
+        else:
+            bucket.append(index)
+
+    def insert_box(self, index: int, x: float, y: float, width: float, height: float):
+        """Bucket an item in every cell its box overlaps"""
+        shift = self.cell_shift
+        cells = self.cells
+        for cell_x in range(int(x) >> shift, (int(x + width) >> shift) + 1):
+            for cell_y in range(int(y) >> shift, (int(y + height) >> shift) + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket is None:
+                    cells[(cell_x, cell_y)] = [index]
+                else:
+                    bucket.append(index)
+
+    def query_box(self, x: float, y: float, width: float, height: float):
+        """
+        Yield the indices bucketed in every cell a box overlaps
+
+        Items inserted with insert_box() can be yielded once per shared cell.
+        """
+        shift = self.cell_shift
+        cells = self.cells
+        for cell_x in range(int(x) >> shift, (int(x + width) >> shift) + 1):
+            for cell_y in range(int(y) >> shift, (int(y + height) >> shift) + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket:
+                    yield from bucket
+
+    def query_radius(self, x: float, y: float, radius: float):
+        """Yield the indices bucketed in every cell a circle's bounding box overlaps"""
+        return self.query_box(x - radius, y - radius, radius * 2, radius * 2)
@@ -1,7 +1,7 @@
 import pygame
 import math
 from typing import Dict, List, Tuple, Optional
-from weapon_types import WEAPON_TYPES, LETHAL_TYPES
+from weapon_types import WEAPON_TYPES, LETHAL_TYPES, PELLET_OFFSETS, RELOAD_SOUNDS
 
 
 class WeaponSystem:
@@ -61,7 +61,7 @@ class WeaponSystem:
         weapon = WEAPON_TYPES[self.current_weapon]
         
         # Apply fire rate modifier from player stats
-        effective_fire_rate = weapon.fire_rate / player.stats["fire_rate"]
+        effective_fire_rate = weapon.fire_rate / player.effective_fire_rate
         
         # Keyboard shooting (spacebar)
         if keys[pygame.K_SPACE]:
@@ -122,13 +122,16 @@ class WeaponSystem:
             player_center_y = player.y + player.height // 2
             
             # Apply damage modifier from player stats
-            modified_damage = player.get_effective_damage(weapon.damage)
+            modified_damage = weapon.damage * player.effective_damage
             
             # Special handling for grenade launcher
             is_explosive = weapon.is_explosive if hasattr(weapon, 'is_explosive') else False
             explosion_radius = weapon.explosion_radius if hasattr(weapon, 'explosion_radius') else 0
             explosion_damage = weapon.explosion_damage if hasattr(weapon, 'explosion_damage') else 0
             
+            # Bullets are [x, y, vx, vy, damage, color, size, angle, is_directional] plus
+            # [is_explosive, vertical velocity, explosion radius, explosion damage] for
+            # explosives; the velocity is fixed here so move_bullets needs no trig
             if mouse_pos:
                 # Calculate angle to mouse position
                 dx = mouse_pos[0] - player_center_x
@@ -140,33 +143,40 @@ class WeaponSystem:
                 
                 # For shotgun, create spread around the target angle
                 if weapon.pellets > 1:
-                    spread_angle = math.radians(20)  # Total spread in radians
-                    angle_step = spread_angle / (weapon.pellets - 1) if weapon.pellets > 1 else 0
-                    start_angle = angle - spread_angle / 2
+                    # Pellet offsets are precomputed per pellet count
+                    pellet_angles = [angle + offset for offset in PELLET_OFFSETS[weapon.pellets]]
                     
-                    for i in range(weapon.pellets):
-                        pellet_angle = start_angle + (i * angle_step)
-                        # Create directional bullet
-                        if is_explosive:
-                            # For explosive bullets, add additional parameters
-                            self.bullets.append([
-                                player_center_x, player_center_y, 1, weapon.bullet_speed,
+                    # Create directional bullets
+                    if is_explosive:
+                        # For explosive bullets, add additional parameters
+                        self.bullets.extend([
+                            [
+                                player_center_x, player_center_y,
+                                weapon.bullet_speed * math.cos(pellet_angle), 0,  # Arc comes from gravity
                                 modified_damage, weapon.bullet_color, weapon.bullet_size, 
                                 pellet_angle, True, is_explosive, 0,  # 0 is initial vertical velocity
                                 explosion_radius, explosion_damage
-                            ])
-                        else:
-                            # Regular bullets
-                            self.bullets.append([
-                                player_center_x, player_center_y, 1, weapon.bullet_speed,
+                            ]
+                            for pellet_angle in pellet_angles
+                        ])
+                    else:
+                        # Regular bullets
+                        self.bullets.extend([
+                            [
+                                player_center_x, player_center_y,
+                                weapon.bullet_speed * math.cos(pellet_angle),
+                                weapon.bullet_speed * math.sin(pellet_angle),
                                 modified_damage, weapon.bullet_color, weapon.bullet_size, pellet_angle, True
-                            ])
+                            ]
+                            for pellet_angle in pellet_angles
+                        ])
                 else:
                     # Create a single directional bullet
                     if is_explosive:
                         # For explosive bullets, add additional parameters
                         self.bullets.append([
-                            player_center_x, player_center_y, 1, weapon.bullet_speed,
+                            player_center_x, player_center_y,
+                            weapon.bullet_speed * math.cos(angle), 0,  # Arc comes from gravity
                             modified_damage, weapon.bullet_color, weapon.bullet_size, 
                             angle, True, is_explosive, 0,  # 0 is initial vertical velocity
                             explosion_radius, explosion_damage
@@ -174,7 +184,8 @@ class WeaponSystem:
                     else:
                         # Regular bullets
                         self.bullets.append([
-                            player_center_x, player_center_y, 1, weapon.bullet_speed,
+                            player_center_x, player_center_y,
+                            weapon.bullet_speed * math.cos(angle), weapon.bullet_speed * math.sin(angle),
                             modified_damage, weapon.bullet_color, weapon.bullet_size, angle, True
                         ])
             else:
@@ -186,8 +197,11 @@ class WeaponSystem:
                     spread = 5
                     for i in range(weapon.pellets):
                         angle = (i - (weapon.pellets - 1) / 2) * spread
+                        angle_rad = math.radians(angle)
                         self.bullets.append([
-                            player_center_x, player_center_y, direction, weapon.bullet_speed,
+                            player_center_x, player_center_y,
+                            weapon.bullet_speed * direction * math.cos(angle_rad),
+                            weapon.bullet_speed * direction * math.sin(angle_rad),
                             modified_damage, weapon.bullet_color, weapon.bullet_size, angle, False
                         ])
                 else:
@@ -195,7 +209,7 @@ class WeaponSystem:
                     if is_explosive:
                         # For explosive bullets, add additional parameters
                         self.bullets.append([
-                            player_center_x, player_center_y, direction, weapon.bullet_speed,
+                            player_center_x, player_center_y, weapon.bullet_speed * direction, 0,
                             modified_damage, weapon.bullet_color, weapon.bullet_size, 
                             0, False, is_explosive, 0,  # 0 is initial vertical velocity
                             explosion_radius, explosion_damage
@@ -203,7 +217,7 @@ class WeaponSystem:
                     else:
                         # Regular bullets
                         self.bullets.append([
-                            player_center_x, player_center_y, direction, weapon.bullet_speed,
+                            player_center_x, player_center_y, weapon.bullet_speed * direction, 0,
                             modified_damage, weapon.bullet_color, weapon.bullet_size, 0, False
                         ])
     
@@ -262,7 +276,7 @@ class WeaponSystem:
         weapon = WEAPON_TYPES[self.current_weapon]
         
         # Apply reload speed modifier from player stats
-        effective_reload_time = player.get_effective_reload_time(weapon.reload_time)
+        effective_reload_time = weapon.reload_time / player.effective_reload_speed
         
         # Check if we need to reload and enough time has passed
         # This handles both auto-reload (ammo == 0) and manual reload (started by pressing R)
@@ -277,14 +291,7 @@ class WeaponSystem:
                 
                 # Play reload sound if we have dedicated channels
                 if self.channels and 'reload' in self.channels:
-                    # Try to play weapon-specific reload sound
-                    try:
-                        reload_sound = pygame.mixer.Sound(f'assets/weapons/sounds/{self.current_weapon}-reload.mp3')
-                        self.channels['reload'].play(reload_sound)
-                    except:
-                        # Fallback to generic reload sound
-                        reload_sound = pygame.mixer.Sound("assets/weapons/sounds/reload.mp3")
-                        self.channels['reload'].play(reload_sound)
+                    self.channels['reload'].play(RELOAD_SOUNDS[self.current_weapon])
     
     def reload_weapon(self, player):
         """Manually reload the current weapon"""
@@ -293,7 +300,7 @@ class WeaponSystem:
         
         # Only reload if not at max capacity and not already reloading
         current_time = pygame.time.get_ticks()
-        effective_reload_time = player.get_effective_reload_time(weapon.reload_time)
+        effective_reload_time = weapon.reload_time / player.effective_reload_speed
         
         # Check if we're already in the middle of a reload
         if current_time - self.last_shot_time < effective_reload_time:
@@ -309,96 +316,108 @@ class WeaponSystem:
         
         # Play reload sound
         if self.channels and 'reload' in self.channels:
-            # Find the appropriate reload sound based on weapon type
-            try:
-                reload_sound = pygame.mixer.Sound(f'assets/weapons/sounds/{self.current_weapon}-reload.mp3')
-                self.channels['reload'].play(reload_sound)
-            except:
-                # Fallback to generic reload sound
-                reload_sound = pygame.mixer.Sound("assets/weapons/sounds/reload.mp3")
-                self.channels['reload'].play(reload_sound)
+            self.channels['reload'].play(RELOAD_SOUNDS[self.current_weapon])
         
         return True
     
     def move_bullets(self):
         """Update the position of all bullets"""
-        for bullet in self.bullets[:]:
+        # Compact surviving bullets in place and in firing order; the enemy
+        # system resolves overlapping hits by bullet order
+        bullets = self.bullets
+        write_index = 0
+        fall_step = self.gravity * 0.5
+        
+        for bullet in bullets:
             # Check if this is an explosive bullet
             is_explosive = len(bullet) > 9 and bullet[9]
             
             # Apply gravity to explosive bullets
             if is_explosive:
-                bullet[10] += self.gravity * 0.5  # Vertical velocity component
+                bullet[10] += fall_step  # Vertical velocity component
                 bullet[1] += bullet[10]  # Apply vertical velocity
             
-            # If bullet has directional angle (new mouse shooting)
-            if len(bullet) > 8 and bullet[8]:  # bullet[8] is True for directional bullets
-                if is_explosive:
-                    # Explosive projectiles move with a slight arc
-                    bullet[0] += bullet[3] * math.cos(bullet[7])
-                else:
-                    # Regular bullets move in a straight line
-                    bullet[0] += bullet[3] * math.cos(bullet[7])
-                    bullet[1] += bullet[3] * math.sin(bullet[7])
-            else:
-                # Original horizontal shooting
-                bullet[0] += bullet[3] * bullet[2] * pygame.math.Vector2(1, 0).rotate(bullet[7]).x
-                bullet[1] += bullet[3] * bullet[2] * pygame.math.Vector2(1, 0).rotate(bullet[7]).y
+            # Velocity components were fixed when the bullet was fired
+            bullet[0] += bullet[2]
+            bullet[1] += bullet[3]
             
             # Check if explosive bullet hit the ground
             if is_explosive and bullet[1] >= self.screen_height - 20:
                 self.create_bullet_explosion(bullet)
-                if bullet in self.bullets:
-                    self.bullets.remove(bullet)
                 continue
                 
             # Check if explosive bullet hit side boundaries
             if is_explosive and (bullet[0] > self.screen_width or bullet[0] < 0):
                 self.create_bullet_explosion(bullet)
-                if bullet in self.bullets:
-                    self.bullets.remove(bullet)
                 continue
                 
-            # Remove regular bullets when they go offscreen
+            # Drop regular bullets when they go offscreen
             if not is_explosive and (bullet[0] > self.screen_width or bullet[0] < 0 or bullet[1] > self.screen_height or bullet[1] < 0):
-                self.bullets.remove(bullet)
+                continue
+            
+            bullets[write_index] = bullet
+            write_index += 1
+        del bullets[write_index:]
                 
     def update_lethals(self, platforms):
         """Update the position and state of thrown lethals and explosions"""
         current_time = pygame.time.get_ticks()
         
-        for lethal in self.thrown_lethals[:]:
-            lethal[3] += self.gravity * 0.5
-            lethal[0] += lethal[2]
-            lethal[1] += lethal[3]
+        # Walk by index and swap-and-pop detonated lethals; their order
+        # doesn't matter, so removal doesn't need to shift the list
+        thrown_lethals = self.thrown_lethals
+        fall_step = self.gravity * 0.5
+        ground_y = self.screen_height - 20
+        i = 0
+        n = len(thrown_lethals)
+        while i < n:
+            lethal = thrown_lethals[i]
+            exploded = False
+            
+            # Integrate in locals and write the new state back once
+            vel_y = lethal[3] + fall_step
+            x = lethal[0] + lethal[2]
+            y = lethal[1] + vel_y
+            lethal[0] = x
+            lethal[1] = y
+            lethal[3] = vel_y
             
-            if lethal[1] >= self.screen_height - 20:
-                if lethal[3] > 2:
+            if y >= ground_y:
+                if vel_y > 2:
                     self.create_explosion(lethal)
-                    self.thrown_lethals.remove(lethal)
+                    exploded = True
                 else:
-                    lethal[1] = self.screen_height - 20
-                    lethal[3] = -lethal[3] * 0.5
+                    lethal[1] = ground_y
+                    lethal[3] = -vel_y * 0.5
             else:
-                lethal_rect = pygame.Rect(lethal[0], lethal[1], 10, 10)
-                for platform in platforms:
-                    if lethal_rect.colliderect(platform):
-                        if lethal[3] > 2:
-                            self.create_explosion(lethal)
-                            self.thrown_lethals.remove(lethal)
-                            break
-                        else:
-                            if lethal[1] < platform.top:
-                                lethal[1] = platform.top - 10
-                                lethal[3] = -lethal[3] * 0.5
-                            elif lethal[1] > platform.bottom:
-                                lethal[1] = platform.bottom
-                                lethal[3] = -lethal[3] * 0.5
-                            else:
-                                lethal[2] = -lethal[2] * 0.5
-        
-        # Process and remove expired explosions
-        for explosion in self.explosions[:]:
+                # Let pygame scan the platforms in C and bounce off the first hit
+                platform_index = pygame.Rect(x, y, 10, 10).collidelist(platforms)
+                if platform_index != -1:
+                    platform = platforms[platform_index]
+                    if vel_y > 2:
+                        self.create_explosion(lethal)
+                        exploded = True
+                    elif y < platform.top:
+                        lethal[1] = platform.top - 10
+                        lethal[3] = -vel_y * 0.5
+                    elif y > platform.bottom:
+                        lethal[1] = platform.bottom
+                        lethal[3] = -vel_y * 0.5
+                    else:
+                        lethal[2] = -lethal[2] * 0.5
+            
+            if exploded:
+                n -= 1
+                thrown_lethals[i] = thrown_lethals[n]
+                thrown_lethals.pop()
+            else:
+                i += 1
+        
+        # Drop expired explosions, compacting the live ones in place and in
+        # spawn order
+        explosions = self.explosions
+        write_index = 0
+        for explosion in explosions:
             # Get the explosion duration based on type
             explosion_type = explosion[2]
             if explosion_type == 'bullet_explosion':
@@ -406,17 +425,19 @@ class WeaponSystem:
             else:
                 explosion_duration = LETHAL_TYPES[explosion_type].explosion_duration
                 
-            # Check if the explosion has expired
-            if current_time - explosion[3] > explosion_duration:
-                self.explosions.remove(explosion)
+            # Keep the explosion until it has expired
+            if current_time - explosion[3] <= explosion_duration:
+                explosions[write_index] = explosion
+                write_index += 1
+        del explosions[write_index:]
                 
     def create_bullet_explosion(self, bullet):
         """Create an explosion from a grenade launcher bullet"""
         # Add explosion effect 
-        self.explosions.append([
+        self.explosions.append((
             bullet[0], bullet[1], 'bullet_explosion',
             pygame.time.get_ticks(), bullet[12], bullet[11]  # Last two are damage and radius
-        ])
+        ))
         
         # Play explosion sound
         if self.channels and 'lethal' in self.channels:
@@ -426,10 +447,10 @@ class WeaponSystem:
     
     def create_explosion(self, lethal):
         """Create an explosion from a thrown lethal"""
-        self.explosions.append([
+        self.explosions.append((
             lethal[0], lethal[1], lethal[4],
             pygame.time.get_ticks()
-        ])
+        ))
         
         # Play explosion sound on dedicated channel
         if self.channels and 'lethal' in self.channels:
@@ -177,6 +177,19 @@ class Environment:
     entry_position: Tuple[int, int]
     exit_position: Tuple[int, int]
     
+    def __post_init__(self) -> None:
+        """Group objects by type so per-frame checks only visit the relevant ones"""
+        # Each bucket pairs the objects with a parallel list of their rects,
+        # so collisions can be swept with Rect.collidelistall
+        self._object_buckets = {}
+        for obj_type in ('door', 'hazard', 'item'):
+            objects = [obj for obj in self.objects if obj.type == obj_type]
+            self._object_buckets[obj_type] = (objects, [obj.rect for obj in objects])
+    
+    def get_object_bucket(self, obj_type: str) -> Tuple[List[MapObject], List[pygame.Rect]]:
+        """Get the objects of a type and their rects, as parallel lists"""
+        return self._object_buckets.get(obj_type, ((), ()))
+    
     # Environment-specific update and draw methods
     def update(self, current_time: int) -> None:
         """Update all objects in the environment"""
@@ -17,7 +17,7 @@ clock = pygame.time.Clock()
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Zombie Survival")
 
-from zombie_types import ZOMBIE_TYPES, initialize_sounds as init_zombie_sounds
+from zombie_types import ZOMBIE_TYPES, ZOMBIE_TYPE_LIST, initialize_sounds as init_zombie_sounds
 from weapon_types import WEAPON_TYPES, LETHAL_TYPES, initialize_sounds as init_weapon_sounds
 from ui.ui import GameUI
 from core.game_state import GameState
@@ -145,7 +145,7 @@ def draw_game():
     for zombie in game_state.zombies:
         game_renderer.draw_zombie(
             zombie[0], zombie[1], zombie[2], zombie[3], 
-            ZOMBIE_TYPES[zombie[2]].health,
+            ZOMBIE_TYPE_LIST[zombie[2]].health,
             zombie
         )
     
@@ -165,8 +165,7 @@ def draw_game():
     game_renderer.draw_explosions(game_state.explosions)
     
     # Draw persistent effects (like fire from molotovs)
-    if hasattr(game_state, 'persistent_effects'):
-        game_renderer.draw_persistent_effects(game_state.persistent_effects)
+    game_renderer.draw_persistent_effects(game_state.persistent_effects)
     
     # Draw player
     game_renderer.draw_player(
@@ -194,7 +193,7 @@ def draw_game():
         
         # Draw environment name when transitioning
         if env_manager.transition_text:
-            progress = min(1.0, (pygame.time.get_ticks() - env_manager.transition_start_time) / 1000)
+            progress = min(1.0, (game_state.current_time - env_manager.transition_start_time) / 1000)
             game_ui.draw_environment_transition_text(screen, env_manager.transition_text, progress)
             
         # Draw upgrade menu if active
@@ -207,7 +206,7 @@ def draw_game():
         # Draw wave start text during intermission countdown
         if not game_state.wave_active and game_state.current_wave > 0:
             # Calculate progress based on time left in intermission
-            time_left = max(0, game_state.intermission_end - pygame.time.get_ticks())
+            time_left = max(0, game_state.intermission_end - game_state.current_time)
             progress = time_left / game_state.WAVE_INTERMISSION_MS
             
             if progress > 0:  # Only show during actual intermission
@@ -262,9 +261,9 @@ def check_door_collision():
     # Use environment manager to check door collisions
     return env_manager.check_door_collision(player_rect)
     
-def handle_door_interaction(keys):
+def handle_door_interaction(interact_held):
     """Handle door interaction with E key"""
-    if keys[pygame.K_e]:
+    if interact_held:
         # Check if player is near a door
         door_collision = check_door_collision()
         if door_collision:
@@ -290,9 +289,8 @@ def handle_door_interaction(keys):
                 game_state.thrown_lethals.clear()  # Clear thrown grenades/molotovs
                 game_state.explosions.clear()  # Clear any active explosions
                 
-                # Clear persistent effects (like fire) if they exist
-                if hasattr(game_state, 'persistent_effects'):
-                    game_state.persistent_effects.clear()
+                # Clear persistent effects (like fire)
+                game_state.persistent_effects.clear()
                 
                 # Show a message about the new area
                 game_ui.show_message(f"Entered {target_env.capitalize()}", 2000)
@@ -301,9 +299,9 @@ def handle_door_interaction(keys):
                 game_state.in_safe_room = (target_env in ['room', 'rooftop'])  # Treat both room and rooftop as safe areas
                 game_state.current_environment = env_manager.get_current_environment().name
 
-def check_room_interactions(keys):
+def check_room_interactions(interact_held):
     """Check for interactions with room objects"""
-    if not keys[pygame.K_e]:
+    if not interact_held:
         return
         
     # Create player rect
@@ -336,7 +334,7 @@ def check_room_interactions(keys):
             lethal_types = list(LETHAL_TYPES.keys())
             
             # Add a lethal item to inventory
-            if 'molotov' not in inventory.item_database or inventory.get_lethal_quantity() < 3:
+            if inventory.get_item_template('molotov') is None or inventory.get_lethal_quantity() < 3:
                 if 'molotov' in lethal_types:
                     inventory.add_item('molotov', 3)
                     sound_controller.play_sound('pickup', 'pickup')
@@ -368,18 +366,18 @@ def check_platform_collision():
     
     return None
 
-def handle_jump_down(keys):
+def handle_jump_down(down_held):
     """Handle jump down mechanic with double tap down"""
     global down_key_pressed_time, down_key_press_count
     
-    current_time = pygame.time.get_ticks()
+    current_time = game_state.current_time
     
     # Reset if enough time has passed
     if current_time - down_key_pressed_time > DOWN_PRESS_THRESHOLD:
         down_key_press_count = 0
     
     # Check if down key is pressed
-    if (keys[pygame.K_DOWN] or keys[pygame.K_s]) and not game_state.is_jumping and game_state.on_ground:
+    if down_held and not game_state.is_jumping and game_state.on_ground:
         platform = check_platform_collision()
         
         # If we're on a platform, handle potential jump down
@@ -408,6 +406,17 @@ def update_horde_sound():
         intermission_end=game_state.intermission_end
     )
 
+def sync_equipped_ammo():
+    """
+    Copy the live ammo count back to the equipped inventory weapon.
+    Called before anything that reads or replaces the inventory weapon
+    (switching, reloading, opening the inventory) rather than every frame.
+    """
+    equipped_weapon = inventory.get_equipped_weapon()
+    current_ammo = game_state.weapon_ammo.get(game_state.current_weapon)
+    if equipped_weapon and current_ammo is not None:
+        equipped_weapon.current_ammo = current_ammo
+
 def main():
     running = True
     
@@ -422,6 +431,12 @@ def main():
     
     inventory.register_use_callback('health_pack', use_health_pack)
     
+    def reset_fire_time():
+        # Allow shooting immediately after a reload
+        game_state.last_fire_time = 0
+    
+    inventory.set_reload_callback(reset_fire_time)
+    
     # Initialize GOD MODE if enabled
     if GOD_MODE:
         # Add all weapons to inventory
@@ -444,6 +459,7 @@ def main():
         game_state.stats["reload_speed"] = 3.0
         game_state.stats["move_speed"] = 2.0
         game_state.stats["max_health"] = 20
+        game_state.refresh_effective_stats()
         game_state.player_health = 20
         
         game_ui.show_message("GOD MODE ENABLED", 3000)
@@ -466,7 +482,18 @@ def main():
     
     while running:
         clock.tick(60)
+        
+        # Read the clock once per frame and share it with the game systems
+        current_time = pygame.time.get_ticks()
+        game_state.set_frame_time(current_time)
+        game_mechanics.set_frame_time(current_time)
+        enemy_system.set_frame_time(current_time)
+        env_manager.set_frame_time(current_time)
+        
         keys = pygame.key.get_pressed()
+        # Read the keys the frame helpers care about once from the snapshot
+        interact_held = keys[pygame.K_e]
+        down_held = keys[pygame.K_DOWN] or keys[pygame.K_s]
         mouse_buttons = pygame.mouse.get_pressed()
         mouse_pos = pygame.mouse.get_pos()
         
@@ -488,6 +515,7 @@ def main():
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_1:
                     # Equip pistol if available
+                    sync_equipped_ammo()
                     for i, slot in enumerate(inventory.slots):
                         if slot.item and slot.item.id == 'pistol':
                             inventory.equip_item(i)
@@ -496,6 +524,7 @@ def main():
                             break
                 elif event.key == pygame.K_2:
                     # Equip shotgun if available
+                    sync_equipped_ammo()
                     for i, slot in enumerate(inventory.slots):
                         if slot.item and slot.item.id == 'shotgun':
                             inventory.equip_item(i)
@@ -504,6 +533,7 @@ def main():
                             break
                 elif event.key == pygame.K_3:
                     # Equip SMG if available
+                    sync_equipped_ammo()
                     for i, slot in enumerate(inventory.slots):
                         if slot.item and slot.item.id == 'smg':
                             inventory.equip_item(i)
@@ -512,6 +542,7 @@ def main():
                             break
                 elif event.key == pygame.K_4:
                     # Equip assault rifle if available
+                    sync_equipped_ammo()
                     for i, slot in enumerate(inventory.slots):
                         if slot.item and slot.item.id == 'ar':
                             inventory.equip_item(i)
@@ -520,6 +551,7 @@ def main():
                             break
                 elif event.key == pygame.K_5:
                     # Equip sniper if available
+                    sync_equipped_ammo()
                     for i, slot in enumerate(inventory.slots):
                         if slot.item and slot.item.id == 'sniper':
                             inventory.equip_item(i)
@@ -528,6 +560,7 @@ def main():
                             break
                 elif event.key == pygame.K_6:
                     # Equip grenade launcher if available
+                    sync_equipped_ammo()
                     for i, slot in enumerate(inventory.slots):
                         if slot.item and slot.item.id == 'grenade_launcher':
                             inventory.equip_item(i)
@@ -542,8 +575,8 @@ def main():
                         game_mechanics.throw_lethal(mouse_pos)
                         # Reduce the lethal count after throwing
                         if inventory.current_lethal is not None:
-                            inventory.slots[inventory.current_lethal].quantity -= 1
-                            if inventory.slots[inventory.current_lethal].quantity <= 0:
+                            inventory.remove_item(inventory.current_lethal, 1)
+                            if inventory.current_lethal is None:
                                 # Auto-cycle to next lethal if available
                                 inventory.cycle_lethal()
                 elif event.key == pygame.K_h:
@@ -556,7 +589,7 @@ def main():
                     running = False
                 elif event.key == pygame.K_e:
                     # For item interactions
-                    check_room_interactions(keys)
+                    check_room_interactions(interact_held)
                 elif event.key == pygame.K_m:
                     # Show map (changed from U key)
                     game_ui.open_map()
@@ -565,6 +598,7 @@ def main():
                     if game_ui.is_inventory_open():
                         game_ui.close_inventory()
                     else:
+                        sync_equipped_ammo()
                         game_ui.open_inventory()
                 elif event.key == pygame.K_UP:
                     # Only handle UP for upgrades if that menu is open
@@ -581,9 +615,8 @@ def main():
                         sound_controller.play_sound('pickup', 'pickup')
                 elif event.key == pygame.K_r and not game_state.in_safe_room and not game_state.game_over:
                     # Manual weapon reload
+                    sync_equipped_ammo()
                     if inventory.reload_weapon():
-                        # Reset fire time to allow shooting immediately after reload
-                        game_state.last_fire_time = 0
                         game_ui.show_message("Reloading...", 2000)
                 elif event.key == pygame.K_ESCAPE:
                     # If inventory or map is open, close it first
@@ -602,6 +635,7 @@ def main():
                             sound_controller.unpause_all()
                 elif event.key == pygame.K_c:
                     # Cycle weapons
+                    sync_equipped_ammo()
                     new_weapon_idx = inventory.cycle_weapon()
                     if new_weapon_idx is not None:
                         game_state.current_weapon = inventory.slots[new_weapon_idx].item.id
@@ -622,8 +656,8 @@ def main():
                         game_mechanics.throw_lethal(mouse_pos)
                         # Reduce the lethal count after throwing
                         if inventory.current_lethal is not None:
-                            inventory.slots[inventory.current_lethal].quantity -= 1
-                            if inventory.slots[inventory.current_lethal].quantity <= 0:
+                            inventory.remove_item(inventory.current_lethal, 1)
+                            if inventory.current_lethal is None:
                                 # Auto-cycle to next lethal if available
                                 inventory.cycle_lethal()
 
@@ -645,13 +679,13 @@ def main():
             continue
             
         # Handle door interactions with E key
-        handle_door_interaction(keys)
+        handle_door_interaction(interact_held)
         
         # Check for room interactions
-        check_room_interactions(keys)
+        check_room_interactions(interact_held)
         
         # Handle the jump down mechanic
-        handle_jump_down(keys)
+        handle_jump_down(down_held)
 
         # Get the current environment
         current_env = env_manager.get_current_environment()
@@ -670,9 +704,8 @@ def main():
             game_state.thrown_lethals.clear()
             game_state.explosions.clear()
             
-            # Clear persistent effects if they exist
-            if hasattr(game_state, 'persistent_effects'):
-                game_state.persistent_effects.clear()
+            # Clear persistent effects
+            game_state.persistent_effects.clear()
                 
             # Show a message about the new area if not at game start
             if game_state.current_environment:  # Skip on first load
@@ -703,20 +736,19 @@ def main():
                 # Full gameplay when in any combat area (building or street)
                 game_mechanics.move_player(keys, current_env.platforms, game_state.stats["move_speed"])
                 game_mechanics.handle_shooting(keys, mouse_buttons, mouse_pos)
-                game_mechanics.move_bullets()
+                # Skip the bullet and lethal passes when there is nothing in flight
+                if game_state.bullets:
+                    game_mechanics.move_bullets()
                 enemy_system.move_zombies()
-                game_mechanics.update_lethals(current_env.platforms)
+                if game_state.thrown_lethals or game_state.explosions or game_state.persistent_effects:
+                    game_mechanics.update_lethals(current_env.platforms)
                 
                 # Check collisions using enemy system
-                bullets_to_remove = enemy_system.check_bullet_collisions(
+                enemy_system.check_bullet_collisions(
                     game_state.bullets,
                     game_mechanics,  # Pass game_mechanics for explosion creation
                     game_state.add_score  # Pass score callback
                 )
-                # Remove bullets that hit zombies
-                for i in sorted(bullets_to_remove, reverse=True):
-                    if i < len(game_state.bullets):
-                        game_state.bullets.pop(i)
                 
                 # Check player collision with zombies
                 should_damage, damage = enemy_system.check_player_collision(
@@ -735,16 +767,9 @@ def main():
                     game_state.add_score
                 )
                 
-                # Get current equipped weapon stats for game mechanics
-                equipped_weapon = inventory.get_equipped_weapon()
-                
-                # Sync ammo count from game mechanics back to inventory
-                if equipped_weapon and game_state.current_weapon in game_state.weapon_ammo:
-                    equipped_weapon.current_ammo = game_state.weapon_ammo[game_state.current_weapon]
-                
                 # Only spawn during active wave periods and not in safe areas
                 if game_state.wave_active and not game_state.in_safe_room:
-                    enemy_system.spawn_zombies(current_env.name, game_state.base_spawn_rate)
+                    enemy_system.spawn_zombies(current_env.name, game_state.get_spawn_rate())
                     
                 game_mechanics.update_weapon_state()
         
@@ -932,12 +932,7 @@ class GameUI:
         pygame.draw.rect(screen, WHITE, (map_x, map_y, map_width, map_height), 2)
         
         # Use the same drawing logic as the minimap but with larger dimensions
-        if world_map and hasattr(world_map, 'draw_map'):
-            # If world_map has its own draw method, use it
-            world_map.draw_map(screen, map_x, map_y, map_width, map_height, current_env)
-        else:
-            # Use our fixed implementation with larger scale
-            self._draw_minimap_fixed(screen, map_x, map_y, map_width, map_height, current_env)
+        self._draw_minimap_fixed(screen, map_x, map_y, map_width, map_height, current_env)
         
         # Draw instructions at bottom
         instructions = self.small_font.render("Press M or ESC to close map", True, WHITE)
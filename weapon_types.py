@@ -1,4 +1,6 @@
+import os
 import pygame
+import math
 from dataclasses import dataclass
 from typing import Tuple
 
@@ -149,6 +151,15 @@ WEAPON_TYPES = {
     )
 }
 
+# Total spread of a directional multi-pellet shot, in radians
+PELLET_SPREAD = math.radians(20)
+
+# Angle offsets for each pellet of a directional shot, keyed by pellet count
+PELLET_OFFSETS = {
+    pellets: tuple(-PELLET_SPREAD / 2 + i * PELLET_SPREAD / (pellets - 1) for i in range(pellets))
+    for pellets in {weapon.pellets for weapon in WEAPON_TYPES.values() if weapon.pellets > 1}
+}
+
 # Define lethal types with placeholder sounds
 LETHAL_TYPES = {
     'grenade': LethalType(
@@ -179,6 +190,12 @@ LETHAL_TYPES = {
     ),
 }
 
+# Magazine size per weapon id, for hot paths that only need the number
+WEAPON_MAX_AMMO = {weapon_id: weapon.max_ammo for weapon_id, weapon in WEAPON_TYPES.items()}
+
+# Reload sounds per weapon id, filled by initialize_sounds()
+RELOAD_SOUNDS = {}
+
 def initialize_sounds():
     """Initialize weapon sounds after pygame.mixer is initialized"""
     global shoot_sound, pistol_fire, shotgun_fire, smg_fire, assault_fire, sniper_fire
@@ -208,4 +225,10 @@ def initialize_sounds():
     # Assign sounds to lethal types
     LETHAL_TYPES['grenade'].sound = explosion_sound
     LETHAL_TYPES['molotov'].sound = molotov_sound
+    
+    # Load reload sounds once; weapons without their own clip share the generic one
+    reload_sound = pygame.mixer.Sound('assets/weapons/sounds/reload.mp3')
+    for weapon_id in WEAPON_TYPES:
+        path = f'assets/weapons/sounds/{weapon_id}-reload.mp3'
+        RELOAD_SOUNDS[weapon_id] = pygame.mixer.Sound(path) if os.path.exists(path) else reload_sound
 
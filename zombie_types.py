@@ -188,6 +188,16 @@ ZOMBIE_TYPES = {
     ),
 }
 
+# Zombie records store their type as a small integer id indexing these tuples
+ZOMBIE_TYPE_KEYS = tuple(ZOMBIE_TYPES)
+ZOMBIE_TYPE_LIST = tuple(ZOMBIE_TYPES.values())
+
+# Half extents of each zombie type's hitbox by type id, for center-based distance checks
+ZOMBIE_HALF_SIZES = tuple(
+    ((zombie_width * zombie_type.size) / 2, (zombie_height * zombie_type.size) / 2)
+    for zombie_type in ZOMBIE_TYPE_LIST
+)
+
 # List to store spit projectiles
 spit_projectiles = []
 